@@ -32,6 +32,12 @@ conda activate myenv39
 print_status "Python version:"
 python --version
 
+# The bot needs Python 3.9+ (see DEPLOYMENT.md)
+if ! python -c 'import sys; sys.exit(sys.version_info < (3, 9))'; then
+    print_error "Python 3.9 or newer is required"
+    exit 1
+fi
+
 print_status "Installing only necessary additional dependencies..."
 
 # Core dependencies that might not be in the shared environment
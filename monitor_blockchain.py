@@ -13,7 +13,6 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
-from solders.signature import Signature
 from rich.console import Console
 from rich.table import Table
 from rich.live import Live
@@ -63,7 +62,7 @@ class BlockchainMonitor:
                 # Get transaction details
                 try:
                     tx_response = await self.client.get_transaction(
-                        Signature.from_string(sig_str),
+                        sig_info.signature,
                         max_supported_transaction_version=0
                     )
                     
@@ -5,8 +5,10 @@ Fixed to use proper AsyncClient methods and ensure reliable connections.
 
 import asyncio
 import random
-from typing import List, Optional, Dict, Any, Callable
+import time
+from typing import List, Optional, Dict, Any, Callable, Tuple
 import aiohttp
+import httpx
 import websockets
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
@@ -18,6 +20,17 @@ import json
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        # WebSocket text frames need str, orjson produces bytes
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional - fall back to the stdlib parser
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = get_logger("connection")
 
 
@@ -27,6 +40,12 @@ class ConnectionManager:
     def __init__(self):
         self.rpc_clients: List[AsyncClient] = []
         self.active_client: Optional[AsyncClient] = None
+        self.active_endpoint: str = ""
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._rpc_request_id: int = 0
+        self._max_concurrent_requests: int = 4
+        # Created inside the running loop by initialize()
+        self._rpc_semaphore: Optional[asyncio.Semaphore] = None
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.pump_ws: Optional[websockets.WebSocketClientProtocol] = None
         self.rpc_endpoints: List[str] = []
@@ -38,7 +57,21 @@ class ConnectionManager:
         self._connection_attempts: int = 0
         self._max_retries: int = 5
         self._retry_delay: float = 2.0
-        self._subscription_callbacks: Dict[int, Callable] = {}
+        # Node-assigned subscription ids are only unique per socket, so
+        # callbacks are keyed by (socket, id) and callers get a local handle
+        self._subscription_callbacks: Dict[Tuple[Any, int], Callable] = {}
+        self._subscriptions: Dict[int, Tuple[Any, int]] = {}
+        self._subscription_handle: int = 0
+        # Serializes connect_websocket so concurrent callers share one socket
+        self._ws_connect_lock: Optional[asyncio.Lock] = None
+        self._pending_ws_requests: Dict[int, asyncio.Future] = {}
+        self._ws_request_id: int = 0
+        self._listener_task: Optional[asyncio.Task] = None
+        # Notifications wait in a per-listener queue for a fixed pool of
+        # dispatch workers, so a burst can't spawn unbounded callback tasks
+        self._notification_workers: int = 4
+        self._notification_queue_size: int = 4096
+        self._dropped_notifications: int = 0
         self._request_queue: List[Callable] = []
         self._processing_queue: bool = False
         self._request_count: int = 0
@@ -65,10 +98,21 @@ class ConnectionManager:
         
         logger.info(f"Created {len(self.rpc_clients)} RPC client(s)")
         
+        # Shared HTTP/2 session for raw JSON-RPC calls - every poller
+        # multiplexes its requests over the same keep-alive connection
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=self._max_concurrent_requests)
+        )
+        # Caps in-flight raw JSON-RPC requests across every caller, matching
+        # the shared session's keep-alive pool
+        self._rpc_semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        
         # Connect to first available client
         await self.connect_rpc()
         # Initialize request rate limiting
-        self._reset_time = asyncio.get_event_loop().time() + (self._window_ms / 1000)
+        self._reset_time = time.monotonic() + (self._window_ms / 1000)
         
     async def connect_rpc(self) -> Optional[AsyncClient]:
         """
@@ -91,6 +135,7 @@ class ConnectionManager:
                 result = await client.get_slot()
                 if result:
                     self.active_client = client
+                    self.active_endpoint = endpoint
                     logger.info(f"✅ Successfully connected to RPC endpoint {i}: {endpoint}")
                     self._connection_attempts = 0
                     return client
@@ -135,15 +180,84 @@ class ConnectionManager:
         """
         Get an active RPC client, reconnecting if needed.
         
+        The active client is handed out without a health probe so hot paths
+        don't pay an extra get_slot round-trip per call. Callers that hit a
+        connection error report it via invalidate_rpc_client().
+        
         Returns:
             Active AsyncClient or None if no connection available
         """
-        if self.active_client and await self.test_connection(self.active_client):
+        if self.active_client:
             return self.active_client
         
         logger.info("Active client not available, attempting to reconnect...")
         return await self.connect_rpc()
     
+    def invalidate_rpc_client(self) -> None:
+        """Drop the active client so the next request reconnects."""
+        self.active_client = None
+    
+    async def rpc_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Send several JSON-RPC requests as a single batch over the shared HTTP/2 session.
+        
+        Args:
+            calls: (method, params) pairs
+            
+        Returns:
+            Results in the same order as calls, None for any call the node rejected
+            
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors such as 429 rate limits
+            RuntimeError: If the RPC node rejects the batch as a whole
+        """
+        if not calls:
+            return []
+        
+        first_id = self._rpc_request_id + 1
+        self._rpc_request_id += len(calls)
+        data = await self._post_json_rpc([
+            {"jsonrpc": "2.0", "id": first_id + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ])
+        
+        if not isinstance(data, list):
+            raise RuntimeError(f"RPC batch rejected: {data.get('error', data)}")
+        
+        # Responses may come back in any order - demultiplex by id
+        results: List[Any] = [None] * len(calls)
+        for item in data:
+            # An error for a request the node couldn't parse carries "id": null
+            request_id = item.get("id")
+            if not isinstance(request_id, int):
+                logger.debug("RPC batch item without an id: %s", item.get("error", item))
+                continue
+            index = request_id - first_id
+            if not 0 <= index < len(calls):
+                continue
+            if "error" in item:
+                logger.debug("RPC error in batched %s: %s", calls[index][0], item["error"])
+            else:
+                results[index] = item.get("result")
+        return results
+    
+    async def _post_json_rpc(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload to the active endpoint and decode the response."""
+        if not self.http_client:
+            raise RuntimeError("HTTP client not initialized")
+        
+        # Re-select a working endpoint after a reported failure
+        if not self.active_client:
+            await self.connect_rpc()
+        
+        async with self._rpc_semaphore:
+            response = await self.http_client.post(
+                self.active_endpoint or self.rpc_endpoints[0],
+                json=payload
+            )
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
     async def connect_websocket(self) -> Optional[websockets.WebSocketClientProtocol]:
         """
         Connect to Solana WebSocket endpoint for real-time data.
@@ -151,9 +265,21 @@ class ConnectionManager:
         Returns:
             WebSocket connection or None if failed
         """
-        if self.websocket and not self.websocket.closed:
+        if self.is_websocket_connected():
             return self.websocket
         
+        # No await between the check and the assignment, so only one lock is made
+        if self._ws_connect_lock is None:
+            self._ws_connect_lock = asyncio.Lock()
+        
+        async with self._ws_connect_lock:
+            # Another caller may have connected while we waited
+            if self.is_websocket_connected():
+                return self.websocket
+            return await self._open_websocket()
+    
+    async def _open_websocket(self) -> Optional[websockets.WebSocketClientProtocol]:
+        """Open the Solana WebSocket and start its listener. Caller holds _ws_connect_lock."""
         try:
             # Remove 'https://' and add 'wss://' for WebSocket
             ws_endpoint = self.websocket_endpoint
@@ -165,15 +291,32 @@ class ConnectionManager:
             self.websocket = await websockets.connect(ws_endpoint)
             logger.info("Connected to Solana WebSocket")
             
-            # Start listening for messages if there are subscriptions
-            if self._subscription_callbacks:
-                asyncio.create_task(self._listen_for_messages(self.websocket))
+            # A single listener owns recv() - subscription replies are routed
+            # back to their callers by request id
+            self._listener_task = asyncio.create_task(self._listen_for_messages(self.websocket))
             return self.websocket
         except Exception as e:
             logger.error(f"Failed to connect to Solana WebSocket: {e}")
             self.websocket = None
             return None
     
+    def is_websocket_connected(self) -> bool:
+        """Check whether the Solana WebSocket is currently open."""
+        return self.websocket is not None and not self.websocket.closed
+    
+    def is_subscription_active(self, subscription_id: int) -> bool:
+        """
+        Check whether a subscription is still delivering notifications.
+        
+        Args:
+            subscription_id: ID returned by subscribe_account or subscribe_logs
+            
+        Returns:
+            False once the socket it was made on has closed
+        """
+        entry = self._subscriptions.get(subscription_id)
+        return entry is not None and not entry[0].closed and entry in self._subscription_callbacks
+    
     async def subscribe_account(self, account: str, callback: Callable[[Any], None]) -> Optional[int]:
         """
         Subscribe to account changes via WebSocket.
@@ -185,69 +328,216 @@ class ConnectionManager:
         Returns:
             Subscription ID or None if failed
         """
-        try:
-            ws = await self.connect_websocket()
-            if not ws:
-                logger.warning("WebSocket not available, skipping subscription")
-                return None
+        subscription_id = await self._subscribe(
+            "accountSubscribe",
+            [
+                account,
+                {
+                    "encoding": "base64",
+                    "commitment": self.commitment
+                }
+            ],
+            callback
+        )
+        if subscription_id is not None:
+            logger.info(f"Subscribed to account: {account[:8]}...", subscription_id=subscription_id)
+        return subscription_id
+    
+    async def subscribe_logs(self, mentions: str, callback: Callable[[Any], None]) -> Optional[int]:
+        """
+        Subscribe to logs of every transaction that mentions an address.
+        
+        Args:
+            mentions: Address the transactions must mention
+            callback: Coroutine called with each notification's result
             
-            # Create subscription request
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "accountSubscribe",
-                "params": [
-                    account,
-                    {
-                        "encoding": "base64",
-                        "commitment": self.commitment.value
-                    }
-                ]
-            }
+        Returns:
+            Subscription ID or None if failed
+        """
+        subscription_id = await self._subscribe(
+            "logsSubscribe",
+            [
+                {"mentions": [mentions]},
+                {"commitment": self.commitment}
+            ],
+            callback
+        )
+        if subscription_id is not None:
+            logger.info(f"Subscribed to logs mentioning: {mentions[:8]}...", subscription_id=subscription_id)
+        return subscription_id
+    
+    async def unsubscribe_logs(self, subscription_id: int) -> bool:
+        """
+        Cancel a logsSubscribe subscription.
+        
+        Args:
+            subscription_id: ID returned by subscribe_logs
             
-            await ws.send(json.dumps(request))
+        Returns:
+            True if the node confirmed the cancellation
+        """
+        # Stop dispatching right away, whatever the node answers
+        entry = self._subscriptions.pop(subscription_id, None)
+        if entry is None:
+            return False
+        self._subscription_callbacks.pop(entry, None)
+        
+        ws, node_subscription_id = entry
+        if ws.closed:
+            return False
+        
+        data = await self._ws_request("logsUnsubscribe", [node_subscription_id], ws)
+        return bool(data and data.get("result"))
+    
+    async def _subscribe(self, method: str, params: List[Any], callback: Callable[[Any], None]) -> Optional[int]:
+        """
+        Send a subscription request and register its callback.
+        
+        Args:
+            method: Subscription method name
+            params: Subscription parameters
+            callback: Callback for the subscription's notifications
+            
+        Returns:
+            Subscription ID or None if failed
+        """
+        ws = await self.connect_websocket()
+        if not ws:
+            logger.warning(f"WebSocket not available, skipping {method}")
+            return None
+        
+        data = await self._ws_request(method, params, ws)
+        if data is None:
+            return None
+        
+        if "result" not in data:
+            logger.error(f"Failed to {method}: {data}")
+            return None
+        
+        # The socket may have dropped while the reply was in flight - its
+        # listener has already cleaned up, so this subscription is dead
+        if ws.closed:
+            logger.warning(f"WebSocket closed during {method}")
+            return None
+        
+        key = (ws, data["result"])
+        self._subscription_handle += 1
+        subscription_id = self._subscription_handle
+        self._subscription_callbacks[key] = callback
+        self._subscriptions[subscription_id] = key
+        return subscription_id
+    
+    async def _ws_request(
+        self,
+        method: str,
+        params: List[Any],
+        ws: websockets.WebSocketClientProtocol
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a JSON-RPC request over a WebSocket and wait for its listener to route back the reply.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            ws: Socket to send on
             
-            # Wait for subscription response
-            response = await ws.recv()
-            data = json.loads(response)
+        Returns:
+            The reply message or None if failed
+        """
+        self._ws_request_id += 1
+        request_id = self._ws_request_id
+        try:
+            reply = asyncio.get_running_loop().create_future()
+            self._pending_ws_requests[request_id] = reply
             
-            if "result" in data:
-                subscription_id = data["result"]
-                self._subscription_callbacks[subscription_id] = callback
-                
-                # Start listening for messages if not already doing so
-                if len(self._subscription_callbacks) == 1:
-                    asyncio.create_task(self._listen_for_messages(ws))
-                
-                logger.info(f"Subscribed to account: {account[:8]}...", subscription_id=subscription_id)
-                return subscription_id
-            else:
-                logger.error(f"Failed to subscribe to account: {data}")
-                return None
+            await ws.send(_json_dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params
+            }))
+            
+            return await asyncio.wait_for(reply, timeout=self.timeout)
                 
         except Exception as e:
-            logger.error(f"Failed to subscribe to account {account[:8]}...: {e}")
+            logger.error(f"Failed to {method}: {e}")
             return None
+        finally:
+            self._pending_ws_requests.pop(request_id, None)
             
     async def _listen_for_messages(self, ws: websockets.WebSocketClientProtocol) -> None:
         """
         Listen for incoming WebSocket messages and dispatch to callbacks.
         
+        Notification callbacks run on a pool of dispatch workers that share
+        a queue with this listener only, so they are awaited, referenced and
+        torn down with it. Notifications already received when the socket
+        closes are still delivered.
+        
         Args:
             ws: WebSocket connection to listen on
         """
+        queue: "asyncio.Queue[Tuple[Callable, Any]]" = asyncio.Queue(maxsize=self._notification_queue_size)
+        workers = [
+            asyncio.create_task(self._dispatch_notifications(queue))
+            for _ in range(self._notification_workers)
+        ]
+        try:
+            await self._receive_messages(ws, queue)
+            
+            # Socket closed - let the workers finish what was already received
+            try:
+                await asyncio.wait_for(queue.join(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropped {queue.qsize()} notification(s) still queued at disconnect")
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+            # Subscriptions do not survive the socket - drop only this socket's,
+            # whether it closed or the listener was cancelled
+            if self.websocket is ws:
+                self.websocket = None
+            for key in [key for key in self._subscription_callbacks if key[0] is ws]:
+                del self._subscription_callbacks[key]
+            for handle in [handle for handle, key in self._subscriptions.items() if key[0] is ws]:
+                del self._subscriptions[handle]
+    
+    async def _receive_messages(
+        self,
+        ws: websockets.WebSocketClientProtocol,
+        queue: "asyncio.Queue[Tuple[Callable, Any]]"
+    ) -> None:
+        """Read messages until the socket closes, routing replies and queueing notifications."""
         try:
             while not ws.closed:
                 try:
                     message = await asyncio.wait_for(ws.recv(), timeout=30.0)
-                    data = json.loads(message)
+                    data = _json_loads(message)
+                    
+                    # Reply to one of our subscription requests
+                    reply = self._pending_ws_requests.get(data.get("id"))
+                    if reply is not None:
+                        if not reply.done():
+                            reply.set_result(data)
+                        continue
                     
                     # Check if this is a subscription notification
-                    if "method" in data and data["method"] == "accountNotification":
-                        subscription_id = data["params"]["subscription"]
-                        if subscription_id in self._subscription_callbacks:
-                            callback = self._subscription_callbacks[subscription_id]
-                            asyncio.create_task(callback(data["params"]["result"]))
+                    if data.get("method", "").endswith("Notification"):
+                        callback = self._subscription_callbacks.get((ws, data["params"]["subscription"]))
+                        if callback is not None:
+                            # Under sustained overload drop the oldest pending
+                            # notification rather than stall the socket
+                            if queue.full():
+                                queue.get_nowait()
+                                queue.task_done()
+                                self._dropped_notifications += 1
+                                logger.warning(
+                                    "Notification queue full, dropped oldest",
+                                    dropped=self._dropped_notifications
+                                )
+                            queue.put_nowait((callback, data["params"]["result"]))
                             
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
@@ -257,7 +547,17 @@ class ConnectionManager:
                     
         except Exception as e:
             logger.error(f"WebSocket listener error: {e}")
-            self.websocket = None
+    
+    async def _dispatch_notifications(self, queue: "asyncio.Queue[Tuple[Callable, Any]]") -> None:
+        """Run queued notification callbacks one at a time."""
+        while True:
+            callback, result = await queue.get()
+            try:
+                await callback(result)
+            except Exception as e:
+                logger.error(f"Error in subscription callback: {e}")
+            finally:
+                queue.task_done()
     
     async def get_recent_signatures(self, address: str, limit: int = 10) -> List[Any]:
         """
@@ -287,6 +587,7 @@ class ConnectionManager:
                 
         except Exception as e:
             logger.error(f"Error fetching signatures for {address[:8]}...: {e}")
+            self.invalidate_rpc_client()
             return []
     
     async def get_transaction(self, signature: str) -> Optional[Any]:
@@ -319,6 +620,7 @@ class ConnectionManager:
                 
         except Exception as e:
             logger.error(f"Error fetching transaction {signature[:8]}...: {e}")
+            self.invalidate_rpc_client()
             return None
     
     async def close(self) -> None:
@@ -331,10 +633,22 @@ class ConnectionManager:
                 except:
                     pass
             
-            # Close WebSocket connections
+            # Close shared HTTP session
+            if self.http_client:
+                await self.http_client.aclose()
+                self.http_client = None
+            
+            # Close the WebSocket before stopping its listener - the listener's
+            # teardown forgets self.websocket, and the node keeps pushing
+            # notifications to a socket left open
             if self.websocket and not self.websocket.closed:
                 await self.websocket.close()
             
+            if self._listener_task:
+                self._listener_task.cancel()
+                await asyncio.gather(self._listener_task, return_exceptions=True)
+                self._listener_task = None
+            
             if self.pump_ws and not self.pump_ws.closed:
                 await self.pump_ws.close()
             
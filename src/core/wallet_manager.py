@@ -90,8 +90,8 @@ class WalletManager:
             SOL balance as float
         """
         try:
-            # Check cache
-            current_time = time.time()
+            # Check cache - monotonic, the TTL is an interval not a date
+            current_time = time.monotonic()
             if not force_refresh and self._balance_cache is not None:
                 if current_time - self._last_balance_check < self.balance_cache_duration:
                     return self._balance_cache
@@ -206,7 +206,7 @@ class WalletManager:
             sig = Signature.from_string(signature)
             
             # Wait for confirmation with timeout
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.monotonic()
             while True:
                 response = await self.client.get_signature_statuses([sig])
                 
@@ -221,7 +221,7 @@ class WalletManager:
                         return False
                 
                 # Check timeout
-                if asyncio.get_event_loop().time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     logger.warning(f"Transaction confirmation timeout | signature={signature}")
                     return False
                 
@@ -114,7 +114,12 @@ class RaydiumDEX(DEXInterface):
             
             # Get recent blockhash
             client = await connection_manager.get_rpc_client()
-            blockhash_resp = await client.get_latest_blockhash()
+            try:
+                blockhash_resp = await client.get_latest_blockhash()
+            except Exception:
+                # Dead endpoint - have the next request reconnect
+                connection_manager.invalidate_rpc_client()
+                raise
             if not blockhash_resp or not blockhash_resp.value:
                 return None
             
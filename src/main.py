@@ -10,6 +10,11 @@ import sys
 from typing import Optional
 import os
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional - the default asyncio loop works too
+    uvloop = None
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -228,6 +233,10 @@ if __name__ == "__main__":
     print(f"📁 Log file: logs/pump_bot.log")
     print("Press Ctrl+C to stop\n")
     
+    # libuv-based loop for lower per-await overhead on the RPC/WebSocket paths
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
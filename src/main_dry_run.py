@@ -109,6 +109,7 @@ class DryRunWalletManager:
                 }
                 simulated_portfolio["total_trades"] += 1
                 logger.info(f"[DRY RUN] ✅ Buy executed: {amount} SOL, New balance: {simulated_portfolio['balance_sol']} SOL")
+                print_portfolio_status()
                 return f"DRY_RUN_TX_{transaction['token'][:8]}"
             else:
                 raise Exception("Insufficient balance for dry run trade")
@@ -139,6 +140,7 @@ class DryRunWalletManager:
                 
                 del simulated_portfolio["positions"][token]
                 logger.info(f"[DRY RUN] ✅ Sell executed: Profit {profit:.4f} SOL ({profit/position['amount_sol']*100:.1f}%)")
+                print_portfolio_status()
                 return f"DRY_RUN_SELL_TX_{token[:8]}"
         
         return "DRY_RUN_TX_UNKNOWN"
@@ -231,19 +233,11 @@ async def start_bot_dry_run():
         
         console.print(Panel.fit("✅ Dry Run Mode Active - Monitoring for opportunities...", style="bold green"))
         console.print()
-        
-        # Periodic status updates
-        async def status_updater():
-            while not shutdown_event.is_set():
-                print_portfolio_status()
-                await asyncio.sleep(30)  # Update every 30 seconds
-        
-        # Run status updater
-        status_task = asyncio.create_task(status_updater())
+        # Status is reprinted by each simulated buy and sell
+        print_portfolio_status()
         
         # Wait for shutdown
         await shutdown_event.wait()
-        status_task.cancel()
         
     except Exception as e:
         logger.error(f"[DRY RUN] Error: {e}", exc_info=True)
@@ -260,7 +260,7 @@ class PositionTracker:
         for token_address in list(self.positions.keys()):
             # TODO: Implement actual price fetching
             # For now, we'll just log that we should update
-            logger.debug(f"Should update price for {token_address[:8]}...")
+            logger.debug("Should update price for %s...", token_address[:8])
             
             # In production, you would:
             # 1. Fetch current price from DEX or price API
@@ -4,7 +4,8 @@ Monitors token prices in real-time.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, List
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Deque
 from datetime import datetime
 import time
 
@@ -29,7 +30,7 @@ class TokenPriceHistory:
     
     def __init__(self, token_address: str, initial_price: float):
         self.token_address: str = token_address
-        self.prices: List[PriceDataPoint] = [PriceDataPoint(initial_price)]
+        self.prices: Deque[PriceDataPoint] = deque([PriceDataPoint(initial_price)])
         self.max_history_seconds: float = 300.0  # Keep 5 minutes of history
         
     def add_price(self, price: float) -> None:
@@ -78,7 +79,10 @@ class TokenPriceHistory:
         """Remove old price data points."""
         current_time = time.time()
         cutoff_time = current_time - self.max_history_seconds
-        self.prices = [p for p in self.prices if p.timestamp >= cutoff_time]
+        # Points arrive in time order, so expired ones are always at the left
+        prices = self.prices
+        while prices and prices[0].timestamp < cutoff_time:
+            prices.popleft()
 
 
 class PriceTracker:
@@ -128,7 +132,7 @@ class PriceTracker:
                             new_price = float(token_data.get("lastPrice", 0.0))
                             if new_price > 0:
                                 self._update_price(token_address, new_price)
-                                logger.debug(f"Updated price for {token_address[:8]}...: ${new_price:.8f}")
+                                logger.debug("Updated price for %s...: $%.8f", token_address[:8], new_price)
                     except Exception as e:
                         logger.error(f"Error updating price for {token_address[:8]}...: {e}")
                 
@@ -13,6 +13,12 @@ from src.utils.config import config_manager
 from src.utils.logger import get_logger
 from src.core.connection_manager import connection_manager
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional - fall back to the stdlib parser
+    _json_loads = json.loads
+
 logger = get_logger("pump_monitor")
 
 
@@ -104,7 +110,7 @@ class PumpMonitor:
                             url = f"https://frontend-api.pump.fun/coins/?wallet={tracked_wallet}"
                             async with session.get(url) as response:
                                 if response.status == 200:
-                                    data = await response.json()
+                                    data = await response.json(loads=_json_loads)
                                     for token_data in data:
                                         self._process_new_token(token_data)
                                 else:
@@ -138,7 +144,7 @@ class PumpMonitor:
                     if token_address in self.tokens:
                         self.tokens[token_address].update(data.get("data", {}))
                 else:
-                    logger.debug(f"Received unhandled event type: {event_type}")
+                    logger.debug("Received unhandled event type: %s", event_type)
                     
             except Exception as e:
                 logger.error(f"Error processing pump.fun event: {e}")
@@ -168,7 +174,7 @@ class PumpMonitor:
                 return
                 
             if token_address in self.tokens:
-                logger.debug(f"Token already tracked: {token_address[:8]}...")
+                logger.debug("Token already tracked: %s...", token_address[:8])
                 self.tokens[token_address].update(token_data)
                 return
                 
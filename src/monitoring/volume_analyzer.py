@@ -4,7 +4,8 @@ Detects volume spikes and unusual trading activity.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, List
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Deque
 import time
 from datetime import datetime
 
@@ -29,7 +30,7 @@ class TokenVolumeHistory:
     
     def __init__(self, token_address: str, initial_volume: float = 0.0):
         self.token_address: str = token_address
-        self.volumes: List[VolumeDataPoint] = [VolumeDataPoint(initial_volume)]
+        self.volumes: Deque[VolumeDataPoint] = deque([VolumeDataPoint(initial_volume)])
         self.max_history_seconds: float = 3600.0  # Keep 1 hour of history
         self.baseline_volume: float = initial_volume
         self.baseline_calculated: bool = False
@@ -111,7 +112,10 @@ class TokenVolumeHistory:
         """Remove old volume data points."""
         current_time = time.time()
         cutoff_time = current_time - self.max_history_seconds
-        self.volumes = [p for p in self.volumes if p.timestamp >= cutoff_time]
+        # Points arrive in time order, so expired ones are always at the left
+        volumes = self.volumes
+        while volumes and volumes[0].timestamp < cutoff_time:
+            volumes.popleft()
 
 
 class VolumeAnalyzer:
@@ -189,7 +193,7 @@ class VolumeAnalyzer:
         else:
             self.volume_history[token_address].add_volume(volume)
             
-        logger.debug(f"Updated volume for {token_address[:8]}...: ${volume:,.2f}")
+        logger.debug("Updated volume for %s...: $%.2f", token_address[:8], volume)
     
     def _notify_volume_spike(self, token_address: str, multiplier: float, current_volume: float) -> None:
         """Notify callbacks about volume spike."""
@@ -5,66 +5,155 @@ Monitors wallets without hitting rate limits.
 # File Location: src/monitoring/wallet_tracker.py
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, List, Set
-import json
-from datetime import datetime
+import base64
+import binascii
+import os
+import random
+import re
+import struct
+from collections import deque, OrderedDict
+from typing import Dict, Any, Optional, Callable, List, Set, Deque, Tuple
 from solders.pubkey import Pubkey as PublicKey
-from solana.rpc.commitment import Confirmed
 import base58
 import time
-from solders.signature import Signature
 
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
+from src.utils.bloom_filter import BloomFilter
 from src.core.connection_manager import connection_manager
 
 logger = get_logger("wallet_tracker")
 
+# Wrapped SOL mint - never the token being bought
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
+# Index of the token mint in a DEX instruction's account list, for programs
+# whose swap account layout is fixed
+TOKEN_MINT_ACCOUNT_INDEX = {
+    PUMP_FUN_PROGRAM: 2,  # Pump.fun buy/sell: global, fee_recipient, mint, ...
+}
+
+
+def _b58_prefix(discriminator: bytes, data_len: int) -> str:
+    """
+    Longest base58 prefix shared by every data_len-byte payload that starts
+    with discriminator.
+    
+    Base58 is not byte-aligned, so the prefix is found by encoding the
+    smallest and largest such payloads and keeping what they agree on.
+    """
+    padding = data_len - len(discriminator)
+    low = base58.b58encode(discriminator + b"\x00" * padding).decode()
+    high = base58.b58encode(discriminator + b"\xff" * padding).decode()
+    return os.path.commonprefix([low, high])
+
+
+# Anchor discriminator of Pump.fun's buy instruction: sha256("global:buy")[:8]
+PUMP_FUN_BUY_DISCRIMINATOR = bytes([102, 6, 61, 18, 1, 218, 235, 234])
+
+# Encoded-data prefixes of a Pump.fun buy - args are amount and max_sol_cost
+# (u64 each), optionally followed by a one-byte track_volume flag
+PUMP_FUN_BUY_PREFIXES = tuple(
+    _b58_prefix(PUMP_FUN_BUY_DISCRIMINATOR, data_len) for data_len in (24, 25)
+)
+
+# Anchor discriminator of Pump.fun's TradeEvent: sha256("event:TradeEvent")[:8]
+PUMP_FUN_TRADE_EVENT_DISCRIMINATOR = bytes([189, 219, 127, 211, 78, 230, 97, 238])
+
+# Leading TradeEvent fields: mint, sol_amount, token_amount, is_buy, user
+PUMP_FUN_TRADE_EVENT = struct.Struct("<32sQQ?32s")
+
+# Log line prefix carrying a base64 Anchor event
+PROGRAM_DATA_PREFIX = "Program data: "
+
+# jsonParsed instruction types that are swaps
+SWAP_INSTRUCTION_TYPES = frozenset({"swap", "swapBaseIn"})
+
+# Log banner for a detected buy - platform, wallet (first 8 chars shown), token,
+# SOL amount, signature
+BUY_BANNER = (
+    "=" * 60 + "\n"
+    "🟢 BUY DETECTED!\n"
+    "Platform: %s\n"
+    "Wallet: %.8s...\n"
+    "Token: %s\n"
+    "Amount: %.6f SOL\n"
+    "TX: https://solscan.io/tx/%s\n"
+    + "=" * 60
+)
+
+# "Program <id> invoke [<depth>]" - captures the invoked program id from any
+# line of a newline-joined log blob
+_PROGRAM_INVOKE_RE = re.compile(r"^Program (\w+) invoke \[", re.MULTILINE)
+
 
 class WalletTracker:
     """
     Wallet tracker with intelligent rate limiting for DRPC.
     """
     
+    # DEX Program IDs - constant, so shared by the class rather than rebuilt per instance
+    DEX_PROGRAMS = {
+        "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8": "Raydium",
+        "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4": "Jupiter", 
+        "JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB": "Jupiter",
+        "JUP3c2Uh3WA4Ng34tw6kPd2G4C5BB21Xo36Je1s32Ph": "Jupiter",
+        "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc": "Orca",
+        "9W959DqEETiGZocYWCQPaJ6sBmUzgfxXfqGeTEdp3aQP": "Orca",
+        "LBUZKhRxPF3XUpBCjp4YzTKgLccjZhTSDM9YuVaPwxo": "Meteora",
+        PUMP_FUN_PROGRAM: "Pump.fun",
+        "9tKE7Mbmj4mxDjWatikzGMszEyKWiuNksioVe4dFAFxF": "OKX DEX",
+        "PhoeNiXZ8ByJGLkxNfZRnkUfjvmuYqLR89jjFHGqdXY": "Phoenix"
+    }
+    
     def __init__(self):
         self.settings = config_manager.get_settings()
         self.tracked_wallets: Set[str] = set(self.settings.tracking.wallets)
-        self.pump_program_id = PublicKey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
-        self.processed_signatures: Set[str] = set()
+        # Recently processed signatures in insertion order (signature -> seen time)
+        self.processed_signatures: "OrderedDict[str, float]" = OrderedDict()
+        self.max_processed_signatures = 1000
+        # Long-tail memory of the last 100k-200k signatures seen, ~5 bytes per entry per generation
+        self.seen_signatures = BloomFilter(capacity=100_000, error_rate=1e-6)
         self.running = False
         self.monitoring_active = False
         self.buy_callbacks: List[Callable] = []
         self.monitoring_tasks: List[asyncio.Task] = []
-        
-        # DEX Program IDs
-        self.DEX_PROGRAMS = {
-            "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8": "Raydium",
-            "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4": "Jupiter", 
-            "JUP4Fb2cqiRUcaTHdrPC8h2gNsA2ETXiPDD33WcGuJB": "Jupiter",
-            "JUP3c2Uh3WA4Ng34tw6kPd2G4C5BB21Xo36Je1s32Ph": "Jupiter",
-            "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc": "Orca",
-            "9W959DqEETiGZocYWCQPaJ6sBmUzgfxXfqGeTEdp3aQP": "Orca",
-            "LBUZKhRxPF3XUpBCjp4YzTKgLccjZhTSDM9YuVaPwxo": "Meteora",
-            "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P": "Pump.fun",
-            "9tKE7Mbmj4mxDjWatikzGMszEyKWiuNksioVe4dFAFxF": "OKX DEX",
-            "PhoeNiXZ8ByJGLkxNfZRnkUfjvmuYqLR89jjFHGqdXY": "Phoenix"
-        }
+        # Wallets without a live log subscription, served by the shared poller
+        self.polled_wallets: Set[str] = set()
+        # Live logsSubscribe subscription per pushed wallet
+        self.log_subscriptions: Dict[str, int] = {}
+        # Newest signature seen per polled wallet - later polls ask only for newer ones
+        self.last_signatures: Dict[str, str] = {}
         
         # RATE LIMITING SETTINGS
         self.poll_interval = 2.0  # Poll every 2 seconds (slower to avoid rate limits)
         self.max_signatures_per_poll = 5  # Fewer signatures per request
+        self.max_new_signatures_per_poll = 25  # Cap once polls are incremental (until=last seen)
         self.rate_limit_delay = 5.0  # Delay after rate limit error
         self.max_requests_per_minute = 20  # Conservative limit for DRPC
-        self.request_times: List[float] = []
-        
-        # Stats
-        self.stats = {
-            "transactions_detected": 0,
-            "buys_detected": 0,
-            "errors": 0,
-            "rate_limit_hits": 0,
-            "last_poll": None
-        }
+        self.request_times: Deque[float] = deque()
+        
+        # Pushed transactions wait here for a small pool of analysis workers,
+        # so a notification burst can't spawn unbounded concurrent fetches
+        self.analysis_workers = 2
+        self.max_analysis_batch = 64  # Queued transactions fetched per JSON-RPC batch
+        self.analysis_queue: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue(maxsize=1000)
+        # Signatures are claimed before the fetch, so a transaction the node
+        # can't return yet is re-queued a few times rather than lost
+        self.max_fetch_retries = 3
+        self.fetch_retry_delay = 2.0
+        self.fetch_attempts: Dict[str, int] = {}
+        self._retry_handles: Dict[str, asyncio.TimerHandle] = {}
+        
+        # Stats - plain attributes so hot-path increments skip a dict lookup;
+        # get_stats() packages them on demand
+        self._transactions_detected = 0
+        self._buys_detected = 0
+        self._errors = 0
+        self._rate_limit_hits = 0
+        self._last_poll: Optional[float] = None
         
         logger.info(f"Wallet tracker initialized - tracking {len(self.tracked_wallets)} wallet(s)")
         logger.info(f"Using DRPC endpoint with rate limiting")
@@ -75,6 +164,15 @@ class WalletTracker:
             logger.warning("Wallet tracker already running")
             return
             
+        # Decode each address once up front - pollers only send the string
+        # form, so a malformed address would otherwise fail on every poll
+        for wallet_address in list(self.tracked_wallets):
+            try:
+                PublicKey.from_string(wallet_address)
+            except Exception:
+                logger.error(f"Invalid wallet address, not tracking: {wallet_address}")
+                self.tracked_wallets.discard(wallet_address)
+        
         if not self.tracked_wallets:
             logger.info("No wallets specified for tracking")
             return
@@ -83,17 +181,26 @@ class WalletTracker:
         self.monitoring_active = True
         logger.info(f"Starting wallet tracker for: {list(self.tracked_wallets)}")
         
-        # Start monitoring task for each wallet
+        # Start monitoring task for each wallet, plus one poller shared by
+        # every wallet that has to fall back to polling
         for wallet_address in self.tracked_wallets:
             task = asyncio.create_task(self._monitor_wallet(wallet_address))
             self.monitoring_tasks.append(task)
             logger.info(f"Started monitoring wallet: {wallet_address}")
+        self.monitoring_tasks.append(asyncio.create_task(self._poll_wallets()))
+        for _ in range(self.analysis_workers):
+            self.monitoring_tasks.append(asyncio.create_task(self._analysis_worker()))
     
     async def stop(self) -> None:
         """Stop tracking wallets."""
         self.running = False
         self.monitoring_active = False
         
+        # Stop the node pushing notifications nobody will consume
+        for subscription_id in self.log_subscriptions.values():
+            await connection_manager.unsubscribe_logs(subscription_id)
+        self.log_subscriptions.clear()
+        
         # Cancel all monitoring tasks
         for task in self.monitoring_tasks:
             task.cancel()
@@ -101,204 +208,477 @@ class WalletTracker:
         await asyncio.gather(*self.monitoring_tasks, return_exceptions=True)
         self.monitoring_tasks.clear()
         
+        for handle in self._retry_handles.values():
+            handle.cancel()
+        self._retry_handles.clear()
+        self.fetch_attempts.clear()
+        self.polled_wallets.clear()
+        self.last_signatures.clear()
+        
         logger.info("Wallet tracker stopped")
     
     async def _check_rate_limit(self) -> None:
         """Check and enforce rate limiting."""
-        current_time = time.time()
+        # Monotonic - a wall-clock adjustment must not empty or freeze the window
+        current_time = time.monotonic()
         
-        # Remove requests older than 1 minute
-        self.request_times = [t for t in self.request_times if current_time - t < 60]
+        # Remove requests older than 1 minute (oldest are always at the left)
+        while self.request_times and current_time - self.request_times[0] >= 60:
+            self.request_times.popleft()
         
         # If we've made too many requests, wait
         if len(self.request_times) >= self.max_requests_per_minute:
             wait_time = 60 - (current_time - self.request_times[0])
             if wait_time > 0:
-                logger.debug(f"Rate limit: waiting {wait_time:.1f}s")
+                logger.debug("Rate limit: waiting %.1fs", wait_time)
                 await asyncio.sleep(wait_time)
-                self.request_times = []
+                self.request_times.clear()
         
         # Record this request
         self.request_times.append(current_time)
     
+    def _claim_signature(self, signature_str: str) -> bool:
+        """
+        Record a signature as processed.
+        
+        Returns:
+            False if the signature was already seen, True if it is new
+        """
+        # Exact check on recent history first, Bloom filter for older signatures
+        if (signature_str in self.processed_signatures
+                or signature_str in self.seen_signatures):
+            return False
+        
+        self.processed_signatures[signature_str] = time.time()
+        self.seen_signatures.add(signature_str)
+        
+        # Keep cache size manageable - evict the oldest entry
+        if len(self.processed_signatures) > self.max_processed_signatures:
+            self.processed_signatures.popitem(last=False)
+        return True
+    
+    def _invokes_dex(self, logs: List[str]) -> bool:
+        """Check a transaction's log messages for an invocation of a known DEX program."""
+        # One C-level scan over the joined logs - only invoke lines come back
+        # to Python, instead of a regex call per log line
+        dex_programs = self.DEX_PROGRAMS
+        for match in _PROGRAM_INVOKE_RE.finditer("\n".join(logs)):
+            if match.group(1) in dex_programs:
+                return True
+        return False
+    
+    def _pump_fun_buys_from_logs(
+        self,
+        logs: List[str],
+        wallet_key: bytes
+    ) -> List[Tuple[str, float]]:
+        """
+        Decode the wallet's Pump.fun buys from TradeEvent log lines.
+        
+        Returns:
+            (token mint, SOL amount) for each buy event whose user is the wallet
+        """
+        buys = []
+        min_size = len(PUMP_FUN_TRADE_EVENT_DISCRIMINATOR) + PUMP_FUN_TRADE_EVENT.size
+        for line in logs:
+            if not line.startswith(PROGRAM_DATA_PREFIX):
+                continue
+            try:
+                data = base64.b64decode(line[len(PROGRAM_DATA_PREFIX):])
+            except (binascii.Error, ValueError):
+                continue
+            if len(data) < min_size or not data.startswith(PUMP_FUN_TRADE_EVENT_DISCRIMINATOR):
+                continue
+            
+            mint, sol_amount, _, is_buy, user = PUMP_FUN_TRADE_EVENT.unpack_from(
+                data, len(PUMP_FUN_TRADE_EVENT_DISCRIMINATOR)
+            )
+            if is_buy and user == wallet_key:
+                buys.append((base58.b58encode(mint).decode(), sol_amount / 1e9))
+        return buys
+    
+    async def _subscribe_wallet_logs(self, wallet_address: str) -> bool:
+        """
+        Have the node push every transaction mentioning the wallet.
+        
+        Returns:
+            True if the logsSubscribe subscription is active
+        """
+        wallet_key = base58.b58decode(wallet_address)
+        
+        async def on_logs(result: Dict[str, Any]) -> None:
+            if not self.running:
+                return
+            
+            value = result.get("value") or {}
+            signature_str = value.get("signature")
+            if not signature_str or not self._claim_signature(signature_str):
+                return
+            
+            # Failed transactions can't be buys
+            if value.get("err") is not None:
+                return
+            
+            # Only fetch transactions whose logs show a DEX being invoked
+            logs = value.get("logs") or []
+            if not self._invokes_dex(logs):
+                return
+            
+            # Pump.fun buys carry their mint and amount in a TradeEvent, so
+            # they are reported without a getTransaction round trip. Anything
+            # else - or logs truncated before the event - is fetched as usual.
+            log_buys = self._pump_fun_buys_from_logs(logs, wallet_key)
+            if log_buys:
+                for token_address, amount_sol in log_buys:
+                    await self._report_buy(
+                        signature_str, wallet_address, token_address, amount_sol, "Pump.fun"
+                    )
+                return
+            
+            await self.analysis_queue.put((signature_str, wallet_address))
+        
+        subscription_id = await connection_manager.subscribe_logs(wallet_address, on_logs)
+        if subscription_id is None:
+            return False
+        
+        self.log_subscriptions[wallet_address] = subscription_id
+        return True
+    
+    async def _analysis_worker(self) -> None:
+        """Analyze pushed transactions from the queue, coalescing bursts into batches."""
+        queue = self.analysis_queue
+        while True:
+            batch = [await queue.get()]
+            
+            # Whatever else is already waiting rides along in the same
+            # JSON-RPC batch - no extra delay when the queue is quiet
+            while len(batch) < self.max_analysis_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await self._analyze_transactions(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
     async def _monitor_wallet(self, wallet_address: str) -> None:
-        """Monitor a wallet for transactions with rate limiting."""
+        """Monitor a wallet by WebSocket push, handing it to the poller as fallback."""
         logger.info(f"Monitoring wallet: {wallet_address}")
+        
+        # Push mode - transactions arrive as they land, no polling traffic
+        if await self._subscribe_wallet_logs(wallet_address):
+            subscription_id = self.log_subscriptions[wallet_address]
+            try:
+                # Watch this wallet's own subscription - a replacement socket
+                # opened for another wallet does not carry it
+                while self.running and connection_manager.is_subscription_active(subscription_id):
+                    self._last_poll = time.time()
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                return
+            
+            if self.running:
+                self.log_subscriptions.pop(wallet_address, None)
+                logger.warning(f"Log subscription lost for {wallet_address[:8]}..., falling back to polling")
+        else:
+            logger.warning(f"Log subscription unavailable for {wallet_address[:8]}..., polling instead")
+        
+        if self.running:
+            self.polled_wallets.add(wallet_address)
+    
+    async def _poll_wallets(self) -> None:
+        """
+        Poll every fallback wallet from a single task.
+        
+        All wallets' signature listings are fetched together in one
+        JSON-RPC batch per poll_interval, so N wallets cost one round-trip
+        and one scheduling tick instead of N.
+        """
         consecutive_errors = 0
         
         while self.running:
+            wallets = list(self.polled_wallets)
             try:
-                # Check rate limit before making request
-                await self._check_rate_limit()
-                
-                # Get RPC client
-                client = await connection_manager.get_rpc_client()
-                if not client:
-                    await asyncio.sleep(5)
-                    continue
-                
-                # Get recent signatures
-                pubkey = PublicKey.from_string(wallet_address)
-                response = await client.get_signatures_for_address(
-                    pubkey,
-                    limit=self.max_signatures_per_poll,
-                    commitment=Confirmed
-                )
-                
-                if response and hasattr(response, 'value') and response.value:
-                    # Process each signature
-                    for sig_info in response.value:
-                        if hasattr(sig_info, 'signature'):
-                            signature_str = str(sig_info.signature)
-                            
-                            # Skip if already processed
-                            if signature_str in self.processed_signatures:
-                                continue
-                            
-                            # Process new transaction
-                            self.processed_signatures.add(signature_str)
-                            
-                            # Keep cache size manageable
-                            if len(self.processed_signatures) > 500:
-                                self.processed_signatures = set(
-                                    list(self.processed_signatures)[-250:]
-                                )
-                            
-                            # Add small delay between transaction analyses
-                            await asyncio.sleep(0.1)
-                            
-                            # Analyze the transaction
-                            await self._analyze_transaction(
-                                client,
-                                signature_str,
-                                wallet_address
-                            )
-                
-                # Update stats
-                self.stats["last_poll"] = time.time()
-                consecutive_errors = 0
+                if wallets:
+                    await self._poll_wallet_batch(wallets)
+                    
+                    # Update stats
+                    self._last_poll = time.time()
+                    consecutive_errors = 0
                 
                 # Wait before next poll
                 await asyncio.sleep(self.poll_interval)
                 
             except asyncio.CancelledError:
-                break
+                return
             except Exception as e:
                 consecutive_errors += 1
                 error_msg = str(e)
                 
                 # Check if it's a rate limit error
                 if "429" in error_msg or "Too Many Requests" in error_msg:
-                    self.stats["rate_limit_hits"] += 1
+                    self._rate_limit_hits += 1
                     logger.warning(f"Rate limit hit! Waiting {self.rate_limit_delay}s...")
                     await asyncio.sleep(self.rate_limit_delay)
                 else:
-                    logger.error(f"Error monitoring wallet {wallet_address}: {error_msg}")
-                    self.stats["errors"] += 1
+                    logger.error(f"Error polling {len(wallets)} wallet(s): {error_msg}")
+                    self._errors += 1
+                    
+                    # Reacquire the RPC connection on the next poll
+                    connection_manager.invalidate_rpc_client()
                     
-                    # Exponential backoff on errors
-                    wait_time = min(30, 2 ** consecutive_errors)
+                    # Exponential backoff on errors - the shift is capped so a
+                    # long outage never builds a huge int, and jitter keeps
+                    # retries from landing in lockstep
+                    wait_time = min(30, 1 << min(consecutive_errors, 5))
+                    wait_time *= 0.5 + random.random() * 0.5
                     await asyncio.sleep(wait_time)
     
-    async def _analyze_transaction(
-        self, 
-        client: Any,
-        signature: str, 
-        wallet_address: str
-    ) -> None:
-        """Analyze a transaction to detect DEX trades."""
+    async def _poll_wallet_batch(self, wallets: List[str]) -> None:
+        """Fetch recent signatures for several wallets and analyze any new transactions."""
+        calls = []
+        new_transactions: List[Tuple[str, str]] = []
+        for wallet_address in wallets:
+            # Only ask for signatures newer than the last one seen - a quiet
+            # wallet then returns an empty list
+            options: Dict[str, Any] = {"commitment": "confirmed"}
+            last_signature = self.last_signatures.get(wallet_address)
+            if last_signature:
+                options["until"] = last_signature
+                options["limit"] = self.max_new_signatures_per_poll
+            else:
+                options["limit"] = self.max_signatures_per_poll
+            calls.append(("getSignaturesForAddress", [wallet_address, options]))
+        
+        # Get recent signatures for every wallet over the shared HTTP/2 session -
+        # one HTTP request, so one charge against the rate limit
+        await self._check_rate_limit()
+        responses = await connection_manager.rpc_batch(calls)
+        
+        for wallet_address, signatures in zip(wallets, responses):
+            if signatures:
+                # Results are newest first
+                newest = signatures[0].get("signature")
+                if newest:
+                    self.last_signatures[wallet_address] = newest
+                
+                # Process each signature
+                for sig_info in signatures:
+                    signature_str = sig_info.get("signature")
+                    if signature_str:
+                        # Skip if already processed
+                        if not self._claim_signature(signature_str):
+                            continue
+                        
+                        # Failed transactions can't be buys - the signature
+                        # listing already carries the error, so skip the
+                        # expensive get_transaction call entirely
+                        if sig_info.get("err") is not None:
+                            continue
+                        
+                        new_transactions.append((signature_str, wallet_address))
+        
+        # Fetch and analyze every wallet's new transactions in one batched request
+        if new_transactions:
+            await self._analyze_transactions(new_transactions)
+    
+    async def _analyze_transactions(self, transactions: List[Tuple[str, str]]) -> None:
+        """
+        Fetch transactions in one JSON-RPC batch and detect DEX trades.
+        
+        Args:
+            transactions: (signature, tracked wallet address) pairs
+        """
+        signatures = [signature for signature, _ in transactions]
         try:
-            # Check rate limit before transaction fetch
+            # The whole batch goes out as one HTTP request - charge it once, so
+            # a burst of signatures isn't held back for minutes before sending
             await self._check_rate_limit()
             
-            # Get full transaction
-            tx_response = await client.get_transaction(
-                Signature.from_string(signature),
-                encoding="jsonParsed",
-                commitment=Confirmed,
-                max_supported_transaction_version=0
-            )
-            
-            if not tx_response or not hasattr(tx_response, 'value') or not tx_response.value:
-                return
-            
-            tx_data = tx_response.value
+            # Fetch at the commitment the log subscription uses - except
+            # getTransaction doesn't accept "processed", so those wait for
+            # confirmation through the retry below
+            commitment = connection_manager.commitment
+            if commitment == "processed":
+                commitment = "confirmed"
             
-            # Convert to dict if needed
-            if hasattr(tx_data, 'to_json'):
-                tx_json = tx_data.to_json()
-                tx_data = json.loads(tx_json)
-            
-            # Check if transaction succeeded
-            meta = tx_data.get("meta", {})
-            if meta.get("err"):
-                return
-            
-            # Get transaction details
-            transaction = tx_data.get("transaction", {})
-            message = transaction.get("message", {})
-            instructions = message.get("instructions", [])
+            # Get full transactions - raw JSON-RPC responses are already dicts
+            tx_config = {
+                "encoding": "jsonParsed",
+                "commitment": commitment,
+                "maxSupportedTransactionVersion": 0
+            }
+            results = await connection_manager.rpc_batch(
+                [("getTransaction", [signature, tx_config]) for signature in signatures]
+            )
             
-            # Check each instruction
-            for instruction in instructions:
-                program_id = instruction.get("programId", "")
-                
-                # Check if it's a DEX interaction
-                if program_id in self.DEX_PROGRAMS:
-                    platform = self.DEX_PROGRAMS[program_id]
-                    
-                    # Analyze for buy/sell
-                    result = await self._parse_dex_instruction(
-                        instruction, 
-                        meta, 
-                        platform,
-                        wallet_address
-                    )
-                    
-                    if result and result.get("is_buy"):
-                        # Detected a buy!
-                        token_address = result.get("token_address", "Unknown")
-                        amount_sol = result.get("amount_sol", 0)
-                        
-                        logger.info(f"="*60)
-                        logger.info(f"🟢 BUY DETECTED!")
-                        logger.info(f"Platform: {platform}")
-                        logger.info(f"Wallet: {wallet_address[:8]}...")
-                        logger.info(f"Token: {token_address}")
-                        logger.info(f"Amount: {amount_sol:.6f} SOL")
-                        logger.info(f"TX: https://solscan.io/tx/{signature}")
-                        logger.info(f"="*60)
-                        
-                        self.stats["transactions_detected"] += 1
-                        self.stats["buys_detected"] += 1
-                        
-                        # Notify callbacks
-                        await self._notify_buy_callbacks(
-                            wallet_address,
-                            token_address,
-                            amount_sol,
-                            platform,
-                            f"https://solscan.io/tx/{signature}"
-                        )
+            missing = []
+            for (signature, wallet_address), tx_data in zip(transactions, results):
+                if tx_data:
+                    self.fetch_attempts.pop(signature, None)
+                    await self._handle_transaction(signature, tx_data, wallet_address)
+                else:
+                    # Not yet visible at this commitment on the node we hit
+                    missing.append((signature, wallet_address))
+            self._retry_transactions(missing)
                         
         except Exception as e:
+            self._retry_transactions(transactions)
             error_msg = str(e)
             if "429" in error_msg:
-                self.stats["rate_limit_hits"] += 1
-                logger.warning(f"Rate limit hit analyzing transaction {signature[:8]}...")
+                self._rate_limit_hits += 1
+                logger.warning(f"Rate limit hit analyzing {len(signatures)} transaction(s)...")
                 await asyncio.sleep(self.rate_limit_delay)
             else:
-                logger.error(f"Error analyzing transaction {signature}: {error_msg}")
-                self.stats["errors"] += 1
+                logger.error(f"Error analyzing transactions {signatures}: {error_msg}")
+                self._errors += 1
+    
+    def _retry_transactions(self, transactions: List[Tuple[str, str]]) -> None:
+        """Re-queue unfetched transactions after a delay, dropping them once out of retries."""
+        if not self.running:
+            return
+        
+        loop = asyncio.get_running_loop()
+        for item in transactions:
+            signature = item[0]
+            attempts = self.fetch_attempts.get(signature, 0) + 1
+            if attempts > self.max_fetch_retries:
+                self.fetch_attempts.pop(signature, None)
+                logger.debug("Giving up on transaction %s after %d attempts", signature, attempts)
+                continue
+            
+            self.fetch_attempts[signature] = attempts
+            # Back off linearly so a lagging node gets progressively longer
+            self._retry_handles[signature] = loop.call_later(
+                self.fetch_retry_delay * attempts, self._requeue_transaction, item
+            )
+    
+    def _requeue_transaction(self, item: Tuple[str, str]) -> None:
+        """Put a transaction back on the analysis queue once its retry delay is up."""
+        self._retry_handles.pop(item[0], None)
+        try:
+            self.analysis_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.fetch_attempts.pop(item[0], None)
+            logger.debug("Analysis queue full, dropping retry of %s", item[0])
+    
+    async def _handle_transaction(
+        self,
+        signature: str,
+        tx_data: Dict[str, Any],
+        wallet_address: str
+    ) -> None:
+        """Report every buy found in a fetched transaction."""
+        for result in self._find_buys(tx_data, wallet_address):
+            await self._report_buy(
+                signature,
+                wallet_address,
+                result.get("token_address", "Unknown"),
+                result.get("amount_sol", 0),
+                result["platform"]
+            )
+    
+    async def _report_buy(
+        self,
+        signature: str,
+        wallet_address: str,
+        token_address: str,
+        amount_sol: float,
+        platform: str
+    ) -> None:
+        """Log a detected buy, count it and notify callbacks."""
+        # One record, formatted by the logging module only if emitted
+        logger.info(
+            BUY_BANNER,
+            platform, wallet_address, token_address, amount_sol, signature
+        )
+        
+        self._transactions_detected += 1
+        self._buys_detected += 1
+        
+        # Notify callbacks
+        await self._notify_buy_callbacks(
+            wallet_address,
+            token_address,
+            amount_sol,
+            platform,
+            f"https://solscan.io/tx/{signature}"
+        )
+    
+    def _find_buys(self, tx_data: Dict[str, Any], wallet_address: str) -> List[Dict[str, Any]]:
+        """
+        Find DEX buys in a fetched transaction.
+        
+        Pure CPU work with no awaits, kept separate from the network-bound
+        _analyze_transactions so it can be run or profiled on its own.
+        """
+        # Check if transaction succeeded
+        meta = tx_data.get("meta", {})
+        if meta.get("err"):
+            return []
+        
+        # Get transaction details
+        transaction = tx_data.get("transaction", {})
+        message = transaction.get("message", {})
+        instructions = message.get("instructions", [])
+        
+        # Locate the tracked wallet once per transaction - every instruction
+        # then reads its balance change by index. A transaction that does not
+        # touch the wallet's balances can't be its buy.
+        wallet_index = -1
+        for index, account_key in enumerate(message.get("accountKeys", [])):
+            if account_key.get("pubkey") == wallet_address:
+                wallet_index = index
+                break
+        if wallet_index < 0:
+            return []
+        
+        buys = []
+        
+        # Check each instruction - one lookup both tests for a DEX
+        # program and resolves its platform name
+        dex_programs = self.DEX_PROGRAMS
+        for instruction in instructions:
+            platform = dex_programs.get(instruction.get("programId", ""))
+            
+            # Check if it's a DEX interaction
+            if platform:
+                # Analyze for buy/sell
+                result = self._parse_dex_instruction(
+                    instruction, 
+                    meta, 
+                    platform,
+                    wallet_index
+                )
+                
+                if result and result.get("is_buy"):
+                    buys.append(result)
+        
+        return buys
     
-    async def _parse_dex_instruction(
+    def _parse_dex_instruction(
         self,
         instruction: Dict,
         meta: Dict,
         platform: str,
-        wallet_address: str
+        wallet_index: int
     ) -> Optional[Dict[str, Any]]:
-        """Parse a DEX instruction to detect buys."""
+        """
+        Parse a DEX instruction to detect buys.
+        
+        Args:
+            instruction: jsonParsed instruction
+            meta: Transaction meta
+            platform: DEX platform name
+            wallet_index: Position of the tracked wallet in the account keys
+        """
+        # A Pump.fun instruction's type is fixed by its discriminator, so sells,
+        # creates and the rest are rejected on the encoded string without any
+        # base58 decode - their balance deltas would otherwise look like buys
+        if (instruction.get("programId") == PUMP_FUN_PROGRAM
+                and not instruction.get("data", "").startswith(PUMP_FUN_BUY_PREFIXES)):
+            return None
+        
         try:
             # Get balance changes
             pre_balances = meta.get("preBalances", [])
@@ -307,30 +687,36 @@ class WalletTracker:
             # Get account keys
             account_keys = meta.get("postTokenBalances", [])
             
-            # Look for SOL decrease (indicating a buy)
-            if pre_balances and post_balances and len(pre_balances) == len(post_balances):
-                # Check first few accounts (usually where wallet is)
-                for i in range(min(5, len(pre_balances))):
-                    sol_change = (post_balances[i] - pre_balances[i]) / 1e9
-                    
-                    if sol_change < -0.0001:  # SOL decreased (likely a buy)
-                        # Try to find token info
-                        token_mint = "Unknown"
+            # Look for a SOL decrease on the tracked wallet (indicating a buy)
+            if (len(pre_balances) == len(post_balances)
+                    and wallet_index < len(pre_balances)):
+                sol_change = (post_balances[wallet_index] - pre_balances[wallet_index]) / 1e9
+                
+                if sol_change < -0.0001:  # SOL decreased (likely a buy)
+                    # Try to find token info - fixed account position first,
+                    # then the first non-SOL token balance
+                    token_mint = "Unknown"
+                    mint_index = TOKEN_MINT_ACCOUNT_INDEX.get(instruction.get("programId"))
+                    accounts = instruction.get("accounts", [])
+                    if mint_index is not None and mint_index < len(accounts):
+                        token_mint = accounts[mint_index]
+                    else:
                         for token_balance in account_keys:
-                            if token_balance.get("uiTokenAmount", {}).get("uiAmount", 0) > 0:
-                                token_mint = token_balance.get("mint", "Unknown")
+                            mint = token_balance.get("mint")
+                            if mint != SOL_MINT and (token_balance.get("uiTokenAmount", {}).get("uiAmount") or 0) > 0:
+                                token_mint = mint or "Unknown"
                                 break
-                        
-                        return {
-                            "is_buy": True,
-                            "token_address": token_mint,
-                            "amount_sol": abs(sol_change),
-                            "platform": platform
-                        }
+                    
+                    return {
+                        "is_buy": True,
+                        "token_address": token_mint,
+                        "amount_sol": abs(sol_change),
+                        "platform": platform
+                    }
             
             # Check parsed instruction
             parsed = instruction.get("parsed", {})
-            if parsed and parsed.get("type") in ["swap", "swapBaseIn"]:
+            if parsed and parsed.get("type") in SWAP_INSTRUCTION_TYPES:
                 info = parsed.get("info", {})
                 return {
                     "is_buy": True,
@@ -342,7 +728,7 @@ class WalletTracker:
             return None
             
         except Exception as e:
-            logger.debug(f"Error parsing {platform} instruction: {e}")
+            logger.debug("Error parsing %s instruction: %s", platform, e)
             return None
     
     async def _notify_buy_callbacks(
@@ -375,10 +761,15 @@ class WalletTracker:
     def get_stats(self) -> Dict[str, Any]:
         """Get tracking statistics."""
         return {
-            **self.stats,
+            "transactions_detected": self._transactions_detected,
+            "buys_detected": self._buys_detected,
+            "errors": self._errors,
+            "rate_limit_hits": self._rate_limit_hits,
+            "last_poll": self._last_poll,
             "tracked_wallets": len(self.tracked_wallets),
             "processed_signatures": len(self.processed_signatures),
-            "request_queue_size": len(self.request_times)
+            "request_queue_size": len(self.request_times),
+            "analysis_queue_size": self.analysis_queue.qsize()
         }
 
 
@@ -390,3 +781,8 @@ def initialize_wallet_tracker():
     global wallet_tracker
     wallet_tracker = WalletTracker()
     return wallet_tracker
+
+
+def get_wallet_tracker() -> Optional[WalletTracker]:
+    """Get the global wallet tracker instance, or None before initialization."""
+    return wallet_tracker
@@ -5,7 +5,10 @@ Fixed async issues - trades will execute properly now.
 # File Location: src/trading/strategy_engine.py
 
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+import logging
+import random
+from collections import deque
+from typing import Dict, List, Optional, Any, Callable, Deque
 from datetime import datetime, timedelta
 import time
 
@@ -13,25 +16,83 @@ from src.utils.config import config_manager
 from src.utils.logger import get_logger
 from src.core.transaction_builder import transaction_builder, initialize_transaction_builder
 from src.monitoring.position_tracker import position_tracker
-from src.monitoring.wallet_tracker import wallet_tracker
 from src.core.wallet_manager import wallet_manager
 
 logger = get_logger("strategy")
 
 
+class Position:
+    """A position opened by the strategy engine."""
+    
+    # Fixed attribute set - no per-instance __dict__. Declared by hand because
+    # dataclass(slots=True) needs Python 3.10.
+    __slots__ = (
+        "token_address", "amount_sol", "tx_signature", "timestamp", "platform",
+        "entry_price", "metadata", "status", "peak_gain", "current_price",
+        "price_change_percent", "volume_spike_ratio", "exit_tx", "exit_time",
+        "exit_reason",
+    )
+    
+    def __init__(
+        self,
+        token_address: str,
+        amount_sol: float,
+        tx_signature: str,
+        timestamp: datetime,
+        platform: str,
+        entry_price: float,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.token_address = token_address
+        self.amount_sol = amount_sol
+        self.tx_signature = tx_signature
+        self.timestamp = timestamp
+        self.platform = platform
+        self.entry_price = entry_price
+        self.metadata: Dict[str, Any] = metadata if metadata is not None else {}
+        self.status = "open"
+        self.peak_gain: Optional[float] = None
+        self.current_price: Optional[float] = None
+        self.price_change_percent: Optional[float] = None
+        self.volume_spike_ratio: Optional[float] = None
+        self.exit_tx: Optional[str] = None
+        self.exit_time: Optional[datetime] = None
+        self.exit_reason: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict copy for API consumers."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["metadata"] = dict(self.metadata)
+        return data
+
+
 class StrategyEngine:
     """
     Manages trading strategies with WORKING copy trading!
     """
     
     def __init__(self):
-        self.settings = config_manager.get_settings().trading
         self.positions: Dict[str, Any] = {}
-        self.trade_history: List[Dict[str, Any]] = []
         self.trade_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        # trade_callbacks split by kind at registration time. Registration
+        # rebinds new lists (copy-on-write), so dispatch iterates a snapshot
+        # that is never mutated underneath it.
+        self._sync_trade_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._async_trade_callbacks: List[Callable[[Dict[str, Any]], Any]] = []
         self.running = False
-        self.active_positions: Dict[str, Any] = {}
-        self.max_positions = self.settings.max_positions
+        self.active_positions: Dict[str, Position] = {}
+        # Open subset of active_positions - closed entries stay in
+        # active_positions for history but drop out of here
+        self._open_positions: Dict[str, Position] = {}
+        # Set while _open_positions is non-empty, so the monitor sleeps when idle
+        self._has_open_positions = asyncio.Event()
+        self._monitor_interval = 5.0
+        # Last time a traceback was logged, per call site and exception type
+        self._error_traceback_times: Dict[str, float] = {}
+        self._error_traceback_interval = 30.0
+        self.reload_settings()
+        # Most recent trades only - the engine runs indefinitely
+        self.trade_history: Deque[Dict[str, Any]] = deque(maxlen=self.settings.trade_history_size)
         
         # Cache balance to avoid repeated calls
         self._cached_balance = 0.0
@@ -59,19 +120,50 @@ class StrategyEngine:
             "OKX DEX Router": {"slippage": 0.02},
             "default": {"slippage": 0.02}
         }
+        
+        # Both tables merged into platform -> (minimum amount, slippage), so
+        # one lookup with one fallback serves every call site
+        self._platform_default = (
+            self.platform_minimums["default"],
+            self.platform_settings["default"]["slippage"]
+        )
+        self._platform_cfg = {
+            platform: (
+                self.platform_minimums.get(platform, self._platform_default[0]),
+                self.platform_settings.get(platform, self.platform_settings["default"])["slippage"]
+            )
+            for platform in self.platform_minimums.keys() | self.platform_settings.keys()
+        }
+    
+    def _log_error(self, where: str, error: Exception) -> None:
+        """Log an error, with a traceback at most once per interval per site and type."""
+        key = f"{where}:{type(error).__name__}"
+        now = time.monotonic()
+        if now - self._error_traceback_times.get(key, float("-inf")) > self._error_traceback_interval:
+            self._error_traceback_times[key] = now
+            logger.error("%s: %s", where, error, exc_info=True)
+        else:
+            logger.error("%s: %s (repeat, traceback suppressed)", where, error)
+    
+    def reload_settings(self) -> None:
+        """(Re)bind trading settings, including the exit thresholds read every monitoring tick."""
+        self.settings = config_manager.get_settings().trading
+        self.max_positions = self.settings.max_positions
+        self._take_profit_pct = float(self.settings.take_profit_percentage)
+        self._stop_loss_pct = float(self.settings.stop_loss_percentage)
+        # Gain at or below which the stop loss fires
+        self._stop_loss_gain = -self._stop_loss_pct
+        self._time_stop_seconds = float(self.settings.time_based_stop_loss_minutes) * 60
+        self._trailing_stop_pct = float(self.settings.trailing_stop_percentage)
+        self._buy_amount_sol = float(self.settings.buy_amount_sol)
+        self._max_buy_amount_sol = float(self.settings.max_buy_amount_sol)
     
     async def initialize(self) -> None:
         """Initialize the strategy engine."""
         logger.info("Strategy engine initialized")
         
         # Register callback with wallet tracker
-        from src.monitoring.wallet_tracker import wallet_tracker
-        if wallet_tracker:
-            wallet_tracker.register_buy_callback(self.handle_tracked_wallet_buy)
-            logger.info("Registered copy trading callback with wallet tracker")
-        
-        # Start monitoring loop
-        asyncio.create_task(self._monitoring_loop())
+        self.register_with_wallet_tracker()
         
         # Get initial balance
         await self._update_cached_balance()
@@ -93,6 +185,11 @@ class StrategyEngine:
             return
         
         self.running = True
+        # stop() leaves the wake-up event set - re-derive it from the positions
+        if self._open_positions:
+            self._has_open_positions.set()
+        else:
+            self._has_open_positions.clear()
         logger.info("Starting strategy engine")
         
         # Initialize if not already done
@@ -104,13 +201,15 @@ class StrategyEngine:
     async def stop(self) -> None:
         """Stop the strategy engine."""
         self.running = False
+        # Wake an idle monitor loop so it sees running is False
+        self._has_open_positions.set()
         logger.info("Stopping strategy engine")
     
     async def _update_cached_balance(self) -> float:
         """Update cached balance."""
         try:
             self._cached_balance = await wallet_manager.get_balance()
-            self._balance_cache_time = time.time()
+            self._balance_cache_time = time.monotonic()
             return self._cached_balance
         except Exception as e:
             logger.error(f"Error updating balance: {e}")
@@ -118,7 +217,7 @@ class StrategyEngine:
     
     async def _get_balance(self) -> float:
         """Get wallet balance with caching."""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Check if cache is still valid
         if current_time - self._balance_cache_time > self._balance_cache_duration:
@@ -138,14 +237,18 @@ class StrategyEngine:
         Handle buy signal from tracked wallet - FIXED async version!
         """
         try:
-            logger.info("="*60)
-            logger.info(f"📋 COPY TRADE SIGNAL DETECTED")
-            logger.info(f"Wallet: {wallet_address[:8]}...")
-            logger.info(f"Token: {token_address}")
-            logger.info(f"Platform: {platform}")
-            logger.info(f"Amount: {amount_sol:.4f} SOL")
+            # One lazily formatted record - %.8s truncates the wallet only if emitted
+            logger.info(
+                "=" * 60 + "\n"
+                "📋 COPY TRADE SIGNAL DETECTED\n"
+                "Wallet: %.8s...\n"
+                "Token: %s\n"
+                "Platform: %s\n"
+                "Amount: %.4f SOL",
+                wallet_address, token_address, platform, amount_sol
+            )
             if tx_url:
-                logger.info(f"TX: {tx_url}")
+                logger.info("TX: %s", tx_url)
             
             # Check if we should copy this trade
             should_copy = await self._should_copy_trade(wallet_address, amount_sol, platform)
@@ -155,7 +258,7 @@ class StrategyEngine:
             # Calculate our copy trade amount
             copy_amount = self._calculate_copy_amount(amount_sol, platform)
             
-            logger.info(f"Executing copy trade for {copy_amount:.4f} SOL on {platform}")
+            logger.info("Executing copy trade for %.4f SOL on %s", copy_amount, platform)
             
             # Execute the copy trade on the SAME platform as tracked wallet
             success = await self.execute_buy(
@@ -172,12 +275,12 @@ class StrategyEngine:
             )
             
             if success:
-                logger.info(f"✅ Copy trade executed successfully on {platform}")
+                logger.info("✅ Copy trade executed successfully on %s", platform)
             else:
-                logger.error(f"❌ Copy trade failed on {platform}")
+                logger.error("❌ Copy trade failed on %s", platform)
             
         except Exception as e:
-            logger.error(f"Error handling tracked wallet buy: {e}", exc_info=True)
+            self._log_error("Error handling tracked wallet buy", e)
     
     async def _should_copy_trade(self, wallet_address: str, amount_sol: float, platform: str) -> bool:
         """Determine if we should copy this trade - ASYNC version."""
@@ -185,26 +288,29 @@ class StrategyEngine:
             # Get current balance
             current_balance = await self._get_balance()
             
-            logger.info(f"Current balance: {current_balance:.4f} SOL")
+            logger.info("Current balance: %.4f SOL", current_balance)
             
             # Check minimum balance
             min_balance = self.settings.min_balance_sol
             if current_balance < min_balance:
-                logger.warning(f"Insufficient balance for copy trade. Current: {current_balance:.4f} SOL, Required: {min_balance:.4f} SOL")
+                logger.warning(
+                    "Insufficient balance for copy trade. Current: %.4f SOL, Required: %.4f SOL",
+                    current_balance, min_balance
+                )
                 return False
             
             # Check if we have capacity
-            if len(self.active_positions) >= self.max_positions:
-                logger.warning(f"Max positions reached ({self.max_positions}), skipping copy trade")
+            if len(self._open_positions) >= self.max_positions:
+                logger.warning("Max positions reached (%d), skipping copy trade", self.max_positions)
                 return False
             
             # Check minimum amount for platform
-            min_amount = self.platform_minimums.get(platform, self.platform_minimums["default"])
+            min_amount, _ = self._platform_cfg.get(platform, self._platform_default)
             if amount_sol < min_amount * 0.5:
-                logger.info(f"Trade amount {amount_sol:.4f} below minimum {min_amount} for {platform}")
+                logger.info("Trade amount %.4f below minimum %s for %s", amount_sol, min_amount, platform)
                 return False
             
-            logger.info(f"✅ Copy trade approved! Balance sufficient and all checks passed.")
+            logger.info("✅ Copy trade approved! Balance sufficient and all checks passed.")
             return True
             
         except Exception as e:
@@ -213,22 +319,19 @@ class StrategyEngine:
     
     def _calculate_copy_amount(self, original_amount: float, platform: str) -> float:
         """Calculate how much to copy trade based on settings."""
-        # Use configured buy amount
-        copy_amount = self.settings.buy_amount_sol
-        
         # Get platform minimum
-        min_amount = self.platform_minimums.get(platform, self.platform_minimums["default"])
-        
-        # Ensure we meet platform minimum
-        if copy_amount < min_amount:
-            copy_amount = min_amount
-            logger.info(f"Adjusted copy amount to platform minimum: {copy_amount:.4f} SOL")
+        min_amount, _ = self._platform_cfg.get(platform, self._platform_default)
         
-        # Don't exceed max buy amount
-        if copy_amount > self.settings.max_buy_amount_sol:
-            copy_amount = self.settings.max_buy_amount_sol
+        # Configured buy amount, raised to the platform minimum and capped at
+        # the max buy amount (the cap wins if the two conflict)
+        copy_amount = min(max(self._buy_amount_sol, min_amount), self._max_buy_amount_sol)
+        if copy_amount != self._buy_amount_sol:
+            logger.debug(
+                "Clamped copy amount %.4f -> %.4f SOL (min=%.4f, max=%.4f) on %s",
+                self._buy_amount_sol, copy_amount, min_amount, self._max_buy_amount_sol, platform
+            )
         
-        logger.info(f"Copy trade amount: {copy_amount:.4f} SOL (original: {original_amount:.4f})")
+        logger.info("Copy trade amount: %.4f SOL (original: %.4f)", copy_amount, original_amount)
         return copy_amount
     
     async def execute_buy(
@@ -240,28 +343,30 @@ class StrategyEngine:
     ) -> bool:
         """Execute a buy order on the specified DEX/platform."""
         try:
-            start_time = time.time()
-            logger.info("="*60)
-            logger.info(f"🚀 EXECUTING BUY ORDER")
-            logger.info(f"Token: {token_address}")
-            logger.info(f"Amount: {amount_sol:.4f} SOL")
-            logger.info(f"Platform: {preferred_dex or 'Auto-detect'}")
+            start_time = time.monotonic()
+            logger.info(
+                "=" * 60 + "\n"
+                "🚀 EXECUTING BUY ORDER\n"
+                "Token: %s\n"
+                "Amount: %.4f SOL\n"
+                "Platform: %s",
+                token_address, amount_sol, preferred_dex or "Auto-detect"
+            )
             
-            if metadata:
+            # Per-field lookups only when INFO records are emitted - the level
+            # check is cached by the logging module and tracks level changes
+            if metadata and logger.isEnabledFor(logging.INFO):
                 if "copy_from_wallet" in metadata:
-                    logger.info(f"Copy from: {metadata['copy_from_wallet'][:8]}...")
+                    logger.info("Copy from: %.8s...", metadata["copy_from_wallet"])
                 if "symbol" in metadata:
-                    logger.info(f"Symbol: {metadata['symbol']}")
+                    logger.info("Symbol: %s", metadata["symbol"])
                 if "market_cap" in metadata:
-                    logger.info(f"Market Cap: ${metadata['market_cap']:,.2f}")
+                    logger.info("Market Cap: $%.2f", metadata["market_cap"])
             
             # Get platform-specific slippage
-            slippage = self.platform_settings.get(
-                preferred_dex or "default", 
-                self.platform_settings["default"]
-            )["slippage"]
+            _, slippage = self._platform_cfg.get(preferred_dex, self._platform_default)
             
-            logger.info(f"Using slippage: {slippage*100:.1f}%")
+            logger.info("Using slippage: %.1f%%", slippage * 100)
             
             # Execute the transaction
             tx_signature = await transaction_builder.build_and_execute_buy_transaction(
@@ -271,24 +376,32 @@ class StrategyEngine:
                 preferred_dex=preferred_dex
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             if tx_signature:
-                logger.info(f"✅ BUY ORDER SUCCESSFUL in {execution_time:.2f}s")
-                logger.info(f"TX: {tx_signature}")
-                logger.info("="*60)
+                logger.info(
+                    "✅ BUY ORDER SUCCESSFUL in %.2fs\n"
+                    "TX: %s\n"
+                    + "=" * 60,
+                    execution_time, tx_signature
+                )
+                
+                # One wall-clock read per trade, shared by the position and callback
+                now = datetime.now()
                 
                 # Track the position
-                self.active_positions[token_address] = {
-                    "token_address": token_address,
-                    "amount_sol": amount_sol,
-                    "tx_signature": tx_signature,
-                    "timestamp": datetime.now(),
-                    "platform": preferred_dex or "unknown",
-                    "status": "open",
-                    "metadata": metadata or {},
-                    "entry_price": amount_sol
-                }
+                position = Position(
+                    token_address=token_address,
+                    amount_sol=amount_sol,
+                    tx_signature=tx_signature,
+                    timestamp=now,
+                    platform=preferred_dex or "unknown",
+                    entry_price=amount_sol,
+                    metadata=metadata or {}
+                )
+                self.active_positions[token_address] = position
+                self._open_positions[token_address] = position
+                self._has_open_positions.set()
                 
                 # Update position tracker
                 await position_tracker.add_position(
@@ -299,27 +412,31 @@ class StrategyEngine:
                     entry_tx=tx_signature
                 )
                 
-                # Trigger callbacks
-                await self._trigger_trade_callback({
+                # Record the trade and trigger callbacks
+                trade = {
                     "type": "buy",
                     "token": token_address,
                     "amount_sol": amount_sol,
                     "tx_signature": tx_signature,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
                     "platform": preferred_dex or "auto"
-                })
+                }
+                self.trade_history.append(trade)
+                if self.trade_callbacks:
+                    await self._trigger_trade_callback(trade)
                 
-                # Update balance cache after successful trade
-                await self._update_cached_balance()
+                # Debit the cached balance optimistically instead of refetching -
+                # the next TTL refresh picks up the settled figure. Headroom of
+                # 20% covers fees and token-account rent.
+                self._cached_balance = max(0.0, self._cached_balance - amount_sol * 1.2)
                 
                 return True
             else:
-                logger.error(f"❌ BUY ORDER FAILED after {execution_time:.2f}s")
-                logger.error("="*60)
+                logger.error("❌ BUY ORDER FAILED after %.2fs\n" + "=" * 60, execution_time)
                 return False
         
         except Exception as e:
-            logger.error(f"Error executing buy: {e}", exc_info=True)
+            self._log_error("Error executing buy", e)
             return False
     
     async def execute_sell(
@@ -331,24 +448,24 @@ class StrategyEngine:
     ) -> bool:
         """Execute a sell order with the SAME exit strategy regardless of platform."""
         try:
-            start_time = time.time()
-            logger.info("="*60)
-            logger.info(f"🔴 EXECUTING SELL ORDER")
-            logger.info(f"Token: {token_address}")
-            logger.info(f"Amount: {amount_tokens:.2f} tokens")
-            logger.info(f"Reason: {reason}")
+            start_time = time.monotonic()
+            logger.info(
+                "=" * 60 + "\n"
+                "🔴 EXECUTING SELL ORDER\n"
+                "Token: %s\n"
+                "Amount: %.2f tokens\n"
+                "Reason: %s",
+                token_address, amount_tokens, reason
+            )
             
             # Get position info
-            position = self.active_positions.get(token_address, {})
-            platform = position.get("platform", "auto")
+            position = self.active_positions.get(token_address)
+            platform = position.platform if position else "auto"
             
-            logger.info(f"Original buy platform: {platform}")
+            logger.info("Original buy platform: %s", platform)
             
             # Get platform-specific slippage
-            slippage = self.platform_settings.get(
-                platform, 
-                self.platform_settings["default"]
-            )["slippage"]
+            _, slippage = self._platform_cfg.get(platform, self._platform_default)
             
             # Execute the transaction
             tx_signature = await transaction_builder.build_and_execute_sell_transaction(
@@ -357,45 +474,56 @@ class StrategyEngine:
                 slippage_tolerance=slippage
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             if tx_signature:
-                logger.info(f"✅ SELL ORDER SUCCESSFUL in {execution_time:.2f}s")
-                logger.info(f"TX: {tx_signature}")
-                logger.info("="*60)
+                logger.info(
+                    "✅ SELL ORDER SUCCESSFUL in %.2fs\n"
+                    "TX: %s\n"
+                    + "=" * 60,
+                    execution_time, tx_signature
+                )
+                
+                # One wall-clock read per trade, shared by the position and callback
+                now = datetime.now()
                 
                 # Update position status
-                if token_address in self.active_positions:
-                    self.active_positions[token_address]["status"] = "closed"
-                    self.active_positions[token_address]["exit_tx"] = tx_signature
-                    self.active_positions[token_address]["exit_time"] = datetime.now()
-                    self.active_positions[token_address]["exit_reason"] = reason
+                if position:
+                    position.status = "closed"
+                    position.exit_tx = tx_signature
+                    position.exit_time = now
+                    position.exit_reason = reason
+                self._open_positions.pop(token_address, None)
+                if not self._open_positions:
+                    self._has_open_positions.clear()
                 
                 # Remove from position tracker
                 await position_tracker.remove_position(token_address)
                 
-                # Trigger callbacks
-                await self._trigger_trade_callback({
+                # Record the trade and trigger callbacks
+                trade = {
                     "type": "sell",
                     "token": token_address,
                     "amount_tokens": amount_tokens,
                     "tx_signature": tx_signature,
                     "reason": reason,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
                     "platform": platform
-                })
+                }
+                self.trade_history.append(trade)
+                if self.trade_callbacks:
+                    await self._trigger_trade_callback(trade)
                 
                 # Update balance cache after successful trade
                 await self._update_cached_balance()
                 
                 return True
             else:
-                logger.error(f"❌ SELL ORDER FAILED after {execution_time:.2f}s")
-                logger.error("="*60)
+                logger.error("❌ SELL ORDER FAILED after %.2fs\n" + "=" * 60, execution_time)
                 return False
         
         except Exception as e:
-            logger.error(f"Error executing sell: {e}", exc_info=True)
+            self._log_error("Error executing sell", e)
             return False
     
     async def evaluate_new_token(self, token_info) -> None:
@@ -404,7 +532,7 @@ class StrategyEngine:
             logger.info(f"Evaluating new token: {token_info.symbol}", token=token_info.address)
             
             # Check if we have capacity
-            if len(self.active_positions) >= self.max_positions:
+            if len(self._open_positions) >= self.max_positions:
                 logger.warning(f"Max positions reached ({self.max_positions}). Skipping {token_info.symbol} evaluation.")
                 return
             
@@ -422,11 +550,11 @@ class StrategyEngine:
         """Evaluate price update for an active position."""
         if token_address in self.active_positions:
             position = self.active_positions[token_address]
-            position['current_price'] = price
-            position['price_change_percent'] = price_change_percent
+            position.current_price = price
+            position.price_change_percent = price_change_percent
             
             logger.debug(
-                f"Price update for {position.get('symbol', 'Unknown')}: {price:.6f} SOL ({price_change_percent:+.2f}%)",
+                f"Price update for {position.metadata.get('symbol', 'Unknown')}: {price:.6f} SOL ({price_change_percent:+.2f}%)",
                 token=token_address
             )
     
@@ -434,10 +562,10 @@ class StrategyEngine:
         """Evaluate volume spike for potential action."""
         if token_address in self.active_positions:
             position = self.active_positions[token_address]
-            position['volume_spike_ratio'] = volume_spike_ratio
+            position.volume_spike_ratio = volume_spike_ratio
             
             logger.info(
-                f"Volume spike detected for {position.get('symbol', 'Unknown')}: {volume_spike_ratio:.2f}x average",
+                f"Volume spike detected for {position.metadata.get('symbol', 'Unknown')}: {volume_spike_ratio:.2f}x average",
                 token=token_address
             )
     
@@ -475,16 +603,25 @@ class StrategyEngine:
     
     async def _monitor_positions(self) -> None:
         """Monitor active positions for selling opportunities."""
+        consecutive_errors = 0
         while self.running:
             try:
-                # Check each position
-                for token_address in list(self.active_positions.keys()):
-                    position = self.active_positions[token_address]
-                    
-                    # Skip if not open
-                    if position.get("status") != "open":
-                        continue
-                    
+                # Nothing to check until a buy opens a position. Clearing first
+                # means a stale wake-up can't turn this into a busy loop.
+                if not self._open_positions:
+                    self._has_open_positions.clear()
+                    await self._has_open_positions.wait()
+                    # stop() wakes the loop too - that is not a new position
+                    if not self.running:
+                        break
+                    continue
+                
+                tick_start = time.monotonic()
+                
+                # Check each open position - metrics are computed locally, the
+                # sells they trigger are the network-bound part
+                sells = []
+                for token_address, position in list(self._open_positions.items()):
                     # Get current metrics
                     try:
                         metrics = await position_tracker.get_position_metrics(token_address)
@@ -493,89 +630,109 @@ class StrategyEngine:
                             should_sell, reason = self._check_exit_conditions(position, metrics)
                             
                             if should_sell:
-                                logger.info(f"Exit condition triggered for {token_address[:8]}...: {reason}")
-                                logger.info(f"Position was bought on: {position.get('platform', 'Unknown')}")
+                                logger.info("Exit condition triggered for %.8s...: %s", token_address, reason)
+                                logger.info("Position was bought on: %s", position.platform)
                                 
-                                await self.execute_sell(
+                                sells.append(self.execute_sell(
                                     token_address=token_address,
                                     amount_tokens=metrics["amount"],
                                     reason=reason
-                                )
+                                ))
                     except Exception as e:
-                        logger.debug(f"Could not get metrics for {token_address[:8]}...: {e}")
+                        logger.debug("Could not get metrics for %.8s...: %s", token_address, e)
+                
+                # Positions exiting on the same tick sell concurrently rather
+                # than each waiting on the previous one's confirmation
+                if sells:
+                    await asyncio.gather(*sells, return_exceptions=True)
                 
-                await asyncio.sleep(5)
+                consecutive_errors = 0
+                # Keep a steady cadence - time spent checking counts toward the interval
+                await asyncio.sleep(max(0.0, self._monitor_interval - (time.monotonic() - tick_start)))
             
             except Exception as e:
-                logger.error(f"Error monitoring positions: {e}", exc_info=True)
-                await asyncio.sleep(10)
-    
-    async def _monitoring_loop(self) -> None:
-        """Monitor positions and market conditions."""
-        while True:
-            try:
-                await asyncio.sleep(30)
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(10)
+                self._log_error("Error monitoring positions", e)
+                # Exponential backoff capped at 30s, jittered
+                backoff = min(30, 1 << min(consecutive_errors, 5)) * (0.5 + random.random() * 0.5)
+                consecutive_errors += 1
+                await asyncio.sleep(backoff)
     
     def _check_exit_conditions(
         self,
-        position: Dict[str, Any],
+        position: Position,
         metrics: Dict[str, Any]
     ) -> tuple[bool, str]:
         """Check if position should be sold based on UNIVERSAL strategy rules."""
         gain_percent = metrics.get("gain_percent", 0)
         time_held = metrics.get("time_held_seconds", 0)
         
-        logger.debug(f"Position metrics: gain={gain_percent:.2f}%, held={time_held/60:.1f}min")
+        logger.debug("Position metrics: gain=%.2f%%, held=%.1fmin", gain_percent, time_held / 60)
+        
+        # Stop loss - same for all platforms. Checked first as the more common
+        # exit for volatile tokens; it can't overlap with take profit.
+        if gain_percent <= self._stop_loss_gain:
+            return True, f"Stop loss: {gain_percent:.1f}% loss"
         
         # Take profit - same for all platforms
-        if gain_percent >= self.settings.take_profit_percentage:
+        if gain_percent >= self._take_profit_pct:
             return True, f"Take profit: {gain_percent:.1f}% gain"
         
-        # Stop loss - same for all platforms
-        if gain_percent <= -self.settings.stop_loss_percentage:
-            return True, f"Stop loss: {gain_percent:.1f}% loss"
-        
         # Time-based stop loss - same for all platforms
-        if self.settings.time_based_stop_loss_minutes > 0:
-            if time_held > self.settings.time_based_stop_loss_minutes * 60:
+        if self._time_stop_seconds > 0:
+            if time_held > self._time_stop_seconds:
                 if gain_percent < 0:
                     return True, f"Time stop: {time_held/60:.0f}min held with {gain_percent:.1f}% loss"
         
         # Trailing stop - same for all platforms
-        if self.settings.trailing_stop_percentage > 0:
-            if hasattr(position, 'peak_gain'):
-                drawdown = position.peak_gain - gain_percent
-                if drawdown >= self.settings.trailing_stop_percentage:
+        trailing_stop_pct = self._trailing_stop_pct
+        if trailing_stop_pct > 0:
+            peak_gain = position.peak_gain
+            # Armed only once the peak is at least the trailing distance, so the
+            # trailing stop never exits below break-even - a position that never
+            # gets that far green is left to the stop loss
+            if peak_gain is not None and peak_gain >= trailing_stop_pct:
+                drawdown = peak_gain - gain_percent
+                if drawdown >= trailing_stop_pct:
                     return True, f"Trailing stop: {drawdown:.1f}% drawdown from peak"
             
             # Update peak gain
-            if not hasattr(position, 'peak_gain') or gain_percent > position.peak_gain:
+            if peak_gain is None or gain_percent > peak_gain:
                 position.peak_gain = gain_percent
         
         return False, ""
     
     async def _trigger_trade_callback(self, trade_data: Dict[str, Any]):
-        """Trigger trade callbacks."""
-        for callback in self.trade_callbacks:
+        """Trigger trade callbacks - sync ones in order, then async ones concurrently."""
+        sync_callbacks = self._sync_trade_callbacks
+        async_callbacks = self._async_trade_callbacks
+        
+        for callback in sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(trade_data)
-                else:
-                    callback(trade_data)
+                callback(trade_data)
             except Exception as e:
                 logger.error(f"Error in trade callback: {e}")
+        
+        if async_callbacks:
+            results = await asyncio.gather(
+                *(callback(trade_data) for callback in async_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in trade callback: {result}")
     
     def register_trade_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Register a callback for trade events."""
         self.trade_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_trade_callbacks = self._async_trade_callbacks + [callback]
+        else:
+            self._sync_trade_callbacks = self._sync_trade_callbacks + [callback]
         logger.info(f"Registered trade callback. Total callbacks: {len(self.trade_callbacks)}")
     
     def get_active_positions(self) -> List[Dict[str, Any]]:
         """Get list of active positions."""
-        return [p for p in self.active_positions.values() if p.get("status") == "open"]
+        return [position.to_dict() for position in self._open_positions.values()]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get strategy statistics."""
@@ -24,6 +24,7 @@ from src.utils.config import config_manager
 from src.utils.logger import get_logger
 from src.core.wallet_manager import wallet_manager
 from src.core.connection_manager import connection_manager
+from src.monitoring.wallet_tracker import get_wallet_tracker
 
 logger = get_logger("cli_ui")
 console = Console()
@@ -380,7 +381,7 @@ class BotCLI:
                 
                 # Update monitor status
                 try:
-                    from src.monitoring.wallet_tracker import wallet_tracker
+                    wallet_tracker = get_wallet_tracker()
                     if wallet_tracker and hasattr(wallet_tracker, 'is_monitoring_active') and wallet_tracker.is_monitoring_active():
                         self.stats["monitor_status"] = "🟢 Active"
                     else:
@@ -405,7 +406,7 @@ class BotCLI:
                 await client.get_slot()
                 return True
         except:
-            pass
+            connection_manager.invalidate_rpc_client()
         return False
     
     async def start(self):
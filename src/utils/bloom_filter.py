@@ -0,0 +1,75 @@
+"""
+Compact Bloom filter for "have we seen this before?" checks.
+Used to remember processed transaction signatures without keeping every string.
+"""
+
+import hashlib
+import math
+import os
+
+
+class BloomFilter:
+    """
+    Fixed-size, two-generation Bloom filter over strings.
+
+    Membership tests can return false positives (at roughly error_rate)
+    but never false negatives among the last `capacity` items. Once
+    `capacity` items have been added the current generation becomes the
+    previous one and a fresh one starts, so memory stays constant without
+    forgetting everything at once. Hashes are keyed with a per-instance
+    random salt so colliding inputs can't be precomputed.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-6):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        # Standard sizing: m = -n*ln(p) / ln(2)^2 bits, k = m/n * ln(2) hashes
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._salt = os.urandom(16)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._previous_bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Derive bit positions via enhanced double hashing of one blake2b digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16, key=self._salt).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        num_bits = self.num_bits
+        positions = []
+        for i in range(self.num_hashes):
+            positions.append(h1 % num_bits)
+            h1 += h2
+            h2 += i
+        return positions
+
+    def add(self, item: str) -> None:
+        """Add an item, rotating generations first if the current one is full."""
+        if self.count >= self.capacity:
+            self._previous_bits = self._bits
+            self._bits = bytearray(len(self._previous_bits))
+            self.count = 0
+
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        positions = self._positions(item)
+        bits = self._bits
+        if all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+            return True
+        previous = self._previous_bits
+        return all(previous[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Forget every item."""
+        self._bits = bytearray(len(self._bits))
+        self._previous_bits = bytearray(len(self._bits))
+        self.count = 0
@@ -50,6 +50,7 @@ class TradingConfig:
     min_liquidity: float = 0  # Minimum liquidity
     trailing_stop_percentage: float = 10  # Trailing stop percentage
     time_based_stop_loss_minutes: int = 60  # Time-based stop loss
+    trade_history_size: int = 10_000  # Trades kept in memory
 
 
 @dataclass
@@ -262,7 +263,8 @@ class ConfigManager:
                     min_market_cap=settings_data['trading'].get('min_market_cap', 4000),
                     min_liquidity=settings_data['trading'].get('min_liquidity', 0),
                     trailing_stop_percentage=settings_data['trading'].get('trailing_stop_percentage', 10),
-                    time_based_stop_loss_minutes=settings_data['trading'].get('time_based_stop_loss_minutes', 60)
+                    time_based_stop_loss_minutes=settings_data['trading'].get('time_based_stop_loss_minutes', 60),
+                    trade_history_size=settings_data['trading'].get('trade_history_size', 10_000)
                 ),
                 monitoring=MonitoringConfig(
                     new_token_check_interval=settings_data['monitoring']['new_token_check_interval'],
@@ -98,35 +98,43 @@ class BotLogger:
         self._trade_count = 0
         self._error_count = 0
     
-    def info(self, message: str, **kwargs):
-        """Log info message with context."""
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at this level would be logged at all."""
+        return self.logger.isEnabledFor(level)
+    
+    @staticmethod
+    def _with_context(message: str, args: tuple, kwargs: dict) -> str:
+        """Append keyword context to a message, keeping %-placeholders intact."""
         extra_info = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
         if extra_info:
+            if args:
+                # Context is literal text once the message is %-formatted
+                extra_info = extra_info.replace("%", "%%")
             message = f"{message} | {extra_info}"
-        self.logger.info(message)
+        return message
+    
+    def info(self, message: str, *args, **kwargs):
+        """
+        Log info message with context.
+        
+        Positional args are %-formatted into the message by the logging
+        module, only if the record is actually emitted.
+        """
+        self.logger.info(self._with_context(message, args, kwargs), *args)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message with context."""
-        extra_info = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        if extra_info:
-            message = f"{message} | {extra_info}"
-        self.logger.warning(message)
+        self.logger.warning(self._with_context(message, args, kwargs), *args)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message with context."""
         self._error_count += 1
         kwargs['error_count'] = self._error_count
-        extra_info = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        if extra_info:
-            message = f"{message} | {extra_info}"
-        self.logger.error(message, exc_info=kwargs.get('exc_info', False))
+        self.logger.error(self._with_context(message, args, kwargs), *args, exc_info=kwargs.get('exc_info', False))
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message with context."""
-        extra_info = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        if extra_info:
-            message = f"{message} | {extra_info}"
-        self.logger.debug(message)
+        self.logger.debug(self._with_context(message, args, kwargs), *args)
     
     def trade_executed(self, action: str, token: str, amount: float, price: float, **kwargs):
         """Log trade execution with structured data."""
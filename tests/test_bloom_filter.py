@@ -0,0 +1,80 @@
+"""
+Tests for the two-generation Bloom filter used to remember processed signatures.
+"""
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Membership, generation rotation and false-positive rate."""
+    
+    def test_added_items_are_members(self):
+        bloom = BloomFilter(capacity=1000, error_rate=1e-6)
+        items = [f"sig-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(len(bloom), 1000)
+    
+    def test_empty_filter_has_no_members(self):
+        bloom = BloomFilter(capacity=1000, error_rate=1e-6)
+        self.assertFalse(any(f"sig-{i}" in bloom for i in range(1000)))
+    
+    def test_rotation_keeps_previous_generation(self):
+        bloom = BloomFilter(capacity=100, error_rate=1e-6)
+        first = [f"first-{i}" for i in range(100)]
+        for item in first:
+            bloom.add(item)
+        
+        # The next add starts a fresh generation - the first one is still consulted
+        bloom.add("second-0")
+        self.assertEqual(len(bloom), 1)
+        self.assertIn("second-0", bloom)
+        self.assertTrue(all(item in bloom for item in first))
+    
+    def test_rotation_forgets_generation_before_previous(self):
+        bloom = BloomFilter(capacity=100, error_rate=1e-6)
+        first = [f"first-{i}" for i in range(100)]
+        second = [f"second-{i}" for i in range(100)]
+        for item in first + second:
+            bloom.add(item)
+        
+        # Third generation pushes the first one out entirely
+        bloom.add("third-0")
+        self.assertTrue(all(item in bloom for item in second))
+        self.assertFalse(any(item in bloom for item in first))
+    
+    def test_false_positive_rate_at_capacity(self):
+        capacity = 10_000
+        error_rate = 0.01
+        bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        for i in range(capacity):
+            bloom.add(f"member-{i}")
+        
+        trials = 20_000
+        false_positives = sum(f"other-{i}" in bloom for i in range(trials))
+        # Allow generous slack over the target so the test is not flaky
+        self.assertLess(false_positives / trials, error_rate * 2)
+    
+    def test_clear_forgets_everything(self):
+        bloom = BloomFilter(capacity=10, error_rate=1e-6)
+        for i in range(15):
+            bloom.add(f"sig-{i}")
+        bloom.clear()
+        
+        self.assertEqual(len(bloom), 0)
+        self.assertFalse(any(f"sig-{i}" in bloom for i in range(15)))
+    
+    def test_salt_differs_per_instance(self):
+        self.assertNotEqual(BloomFilter(capacity=10)._salt, BloomFilter(capacity=10)._salt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests for the strategy engine's exit rules.
+"""
+import os
+import sys
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.config import TradingConfig
+from src.trading.strategy_engine import StrategyEngine, Position
+
+
+def make_engine(**trading) -> StrategyEngine:
+    """Engine with the shipped exit settings unless overridden."""
+    settings = {
+        "max_positions": 5,
+        "max_buy_amount_sol": 0.1,
+        "take_profit_percentage": 50,
+        "stop_loss_percentage": 25,
+        "trailing_stop_percentage": 10,
+        "time_based_stop_loss_minutes": 60,
+    }
+    settings.update(trading)
+    bot_settings = SimpleNamespace(trading=TradingConfig(**settings))
+    with patch("src.trading.strategy_engine.config_manager") as config:
+        config.get_settings.return_value = bot_settings
+        return StrategyEngine()
+
+
+def make_position() -> Position:
+    return Position(
+        token_address="token",
+        amount_sol=0.01,
+        tx_signature="sig",
+        timestamp=datetime.now(),
+        platform="Pump.fun",
+        entry_price=0.01
+    )
+
+
+class TestExitConditions(unittest.TestCase):
+    """_check_exit_conditions over a sequence of observed gains."""
+    
+    def run_gains(self, engine, position, gains):
+        """Feed gains until one triggers an exit; return (gain, reason) or None."""
+        for gain in gains:
+            should_sell, reason = engine._check_exit_conditions(
+                position, {"gain_percent": gain, "time_held_seconds": 60}
+            )
+            if should_sell:
+                return gain, reason
+        return None
+    
+    def test_never_green_position_exits_at_stop_loss(self):
+        engine = make_engine()
+        result = self.run_gains(engine, make_position(), [0, -2, -5, -10, -15, -20, -24, -25])
+        
+        self.assertIsNotNone(result)
+        gain, reason = result
+        self.assertEqual(gain, -25)
+        self.assertTrue(reason.startswith("Stop loss"))
+    
+    def test_barely_green_position_not_trailed_below_break_even(self):
+        engine = make_engine()
+        result = self.run_gains(engine, make_position(), [0, 5, 0, -6, -12])
+        
+        self.assertIsNone(result)
+    
+    def test_trailing_stop_after_peak(self):
+        engine = make_engine()
+        position = make_position()
+        result = self.run_gains(engine, position, [0, 10, 30, 25, 21, 20])
+        
+        self.assertIsNotNone(result)
+        gain, reason = result
+        self.assertEqual(gain, 20)
+        self.assertTrue(reason.startswith("Trailing stop"))
+        self.assertEqual(position.peak_gain, 30)
+    
+    def test_trailing_stop_disabled(self):
+        engine = make_engine(trailing_stop_percentage=0)
+        result = self.run_gains(engine, make_position(), [0, 30, 15, 1])
+        
+        self.assertIsNone(result)
+    
+    def test_take_profit(self):
+        engine = make_engine()
+        gain, reason = self.run_gains(engine, make_position(), [0, 20, 49, 50])
+        
+        self.assertEqual(gain, 50)
+        self.assertTrue(reason.startswith("Take profit"))
+    
+    def test_time_stop_only_when_losing(self):
+        engine = make_engine()
+        position = make_position()
+        
+        should_sell, _ = engine._check_exit_conditions(
+            position, {"gain_percent": 2, "time_held_seconds": 2 * 3600}
+        )
+        self.assertFalse(should_sell)
+        
+        should_sell, reason = engine._check_exit_conditions(
+            position, {"gain_percent": -1, "time_held_seconds": 2 * 3600}
+        )
+        self.assertTrue(should_sell)
+        self.assertTrue(reason.startswith("Time stop"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for Pump.fun buy detection in the wallet tracker: the encoded
+buy-instruction prefix gate and TradeEvent decoding from pushed logs.
+"""
+import base64
+import hashlib
+import os
+import struct
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import base58
+
+from src.monitoring.wallet_tracker import (
+    WalletTracker,
+    PUMP_FUN_PROGRAM,
+    PUMP_FUN_BUY_DISCRIMINATOR,
+    PUMP_FUN_BUY_PREFIXES,
+    PUMP_FUN_TRADE_EVENT_DISCRIMINATOR,
+    PROGRAM_DATA_PREFIX,
+)
+
+SELL_DISCRIMINATOR = hashlib.sha256(b"global:sell").digest()[:8]
+
+WALLET = bytes(range(1, 33))
+OTHER_WALLET = bytes(range(33, 65))
+MINT = bytes(range(100, 132))
+
+
+def instruction_data(discriminator: bytes, amount: int, max_sol: int, track_volume=None) -> str:
+    """Base58 instruction data as jsonParsed returns it for unparsed programs."""
+    data = discriminator + struct.pack("<QQ", amount, max_sol)
+    if track_volume is not None:
+        data += bytes([track_volume])
+    return base58.b58encode(data).decode()
+
+
+def trade_event_line(mint: bytes, sol_amount: int, token_amount: int, is_buy: bool, user: bytes) -> str:
+    """A 'Program data:' log line carrying a TradeEvent."""
+    payload = (
+        PUMP_FUN_TRADE_EVENT_DISCRIMINATOR
+        + mint
+        + struct.pack("<QQ?", sol_amount, token_amount, is_buy)
+        + user
+        # timestamp, virtual/real reserves - trailing fields the decoder ignores
+        + struct.pack("<qQQQQ", 1_700_000_000, 1, 2, 3, 4)
+    )
+    return PROGRAM_DATA_PREFIX + base64.b64encode(payload).decode()
+
+
+def make_tracker() -> WalletTracker:
+    """Tracker without settings - the decoders under test use no instance state."""
+    return WalletTracker.__new__(WalletTracker)
+
+
+class TestBuyDiscriminators(unittest.TestCase):
+    """The hard-coded discriminators match their Anchor definitions."""
+    
+    def test_buy_instruction_discriminator(self):
+        self.assertEqual(PUMP_FUN_BUY_DISCRIMINATOR, hashlib.sha256(b"global:buy").digest()[:8])
+    
+    def test_trade_event_discriminator(self):
+        self.assertEqual(
+            PUMP_FUN_TRADE_EVENT_DISCRIMINATOR,
+            hashlib.sha256(b"event:TradeEvent").digest()[:8]
+        )
+
+
+class TestBuyPrefixGate(unittest.TestCase):
+    """Encoded instruction data is classified without decoding it."""
+    
+    def test_buy_payloads_match(self):
+        for amount, max_sol in [(0, 0), (1, 1), (123_456_789, 50_000_000), (2**64 - 1, 2**64 - 1)]:
+            for track_volume in (None, 0, 1):
+                data = instruction_data(PUMP_FUN_BUY_DISCRIMINATOR, amount, max_sol, track_volume)
+                self.assertTrue(data.startswith(PUMP_FUN_BUY_PREFIXES), (amount, max_sol, track_volume))
+    
+    def test_sell_payloads_rejected(self):
+        for amount, min_sol in [(0, 0), (1, 1), (123_456_789, 50_000_000), (2**64 - 1, 2**64 - 1)]:
+            data = instruction_data(SELL_DISCRIMINATOR, amount, min_sol)
+            self.assertFalse(data.startswith(PUMP_FUN_BUY_PREFIXES), (amount, min_sol))
+    
+    def test_parse_rejects_sell_instruction(self):
+        tracker = make_tracker()
+        meta = {"preBalances": [5_000_000_000], "postBalances": [4_000_000_000], "postTokenBalances": []}
+        accounts = ["global", "fee", base58.b58encode(MINT).decode()]
+        
+        sell = {"programId": PUMP_FUN_PROGRAM, "accounts": accounts,
+                "data": instruction_data(SELL_DISCRIMINATOR, 1000, 1)}
+        self.assertIsNone(tracker._parse_dex_instruction(sell, meta, "Pump.fun", 0))
+        
+        buy = {"programId": PUMP_FUN_PROGRAM, "accounts": accounts,
+               "data": instruction_data(PUMP_FUN_BUY_DISCRIMINATOR, 1000, 2_000_000_000)}
+        result = tracker._parse_dex_instruction(buy, meta, "Pump.fun", 0)
+        self.assertIsNotNone(result)
+        self.assertEqual(result["token_address"], accounts[2])
+        self.assertAlmostEqual(result["amount_sol"], 1.0)
+
+
+class TestTradeEventDecoding(unittest.TestCase):
+    """Pump.fun buys are read straight from pushed logs."""
+    
+    def setUp(self):
+        self.tracker = make_tracker()
+    
+    def test_wallet_buy_decoded(self):
+        logs = [
+            f"Program {PUMP_FUN_PROGRAM} invoke [1]",
+            "Program log: Instruction: Buy",
+            trade_event_line(MINT, 250_000_000, 1_000_000, True, WALLET),
+            f"Program {PUMP_FUN_PROGRAM} success",
+        ]
+        self.assertEqual(
+            self.tracker._pump_fun_buys_from_logs(logs, WALLET),
+            [(base58.b58encode(MINT).decode(), 0.25)]
+        )
+    
+    def test_sell_event_rejected(self):
+        logs = [trade_event_line(MINT, 250_000_000, 1_000_000, False, WALLET)]
+        self.assertEqual(self.tracker._pump_fun_buys_from_logs(logs, WALLET), [])
+    
+    def test_other_users_buy_rejected(self):
+        logs = [trade_event_line(MINT, 250_000_000, 1_000_000, True, OTHER_WALLET)]
+        self.assertEqual(self.tracker._pump_fun_buys_from_logs(logs, WALLET), [])
+    
+    def test_truncated_and_foreign_data_ignored(self):
+        full = base64.b64decode(trade_event_line(MINT, 1, 1, True, WALLET)[len(PROGRAM_DATA_PREFIX):])
+        logs = [
+            # Cut off before the user field
+            PROGRAM_DATA_PREFIX + base64.b64encode(full[:60]).decode(),
+            # Another program's event with the same layout length
+            PROGRAM_DATA_PREFIX + base64.b64encode(b"\x00" * 8 + full[8:]).decode(),
+            # Not base64 at all
+            PROGRAM_DATA_PREFIX + "not*base64!",
+            "Program log: Instruction: Buy",
+        ]
+        self.assertEqual(self.tracker._pump_fun_buys_from_logs(logs, WALLET), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
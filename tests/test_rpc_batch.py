@@ -0,0 +1,114 @@
+"""
+Tests for JSON-RPC batch demultiplexing in the connection manager.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.connection_manager import ConnectionManager
+
+
+class TestRpcBatch(unittest.IsolatedAsyncioTestCase):
+    """rpc_batch maps each response back to its call by id."""
+    
+    def setUp(self):
+        self.manager = ConnectionManager()
+        self.manager._post_json_rpc = AsyncMock()
+    
+    def _sent_ids(self):
+        payload = self.manager._post_json_rpc.await_args.args[0]
+        return [request["id"] for request in payload]
+    
+    async def test_results_in_call_order(self):
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 1, "result": "a"},
+            {"jsonrpc": "2.0", "id": 2, "result": "b"},
+        ]
+        results = await self.manager.rpc_batch([("getSlot", []), ("getHealth", [])])
+        
+        self.assertEqual(results, ["a", "b"])
+        payload = self.manager._post_json_rpc.await_args.args[0]
+        self.assertEqual([r["method"] for r in payload], ["getSlot", "getHealth"])
+    
+    async def test_out_of_order_replies(self):
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 3, "result": "c"},
+            {"jsonrpc": "2.0", "id": 1, "result": "a"},
+            {"jsonrpc": "2.0", "id": 2, "result": "b"},
+        ]
+        results = await self.manager.rpc_batch([("m", [1]), ("m", [2]), ("m", [3])])
+        
+        self.assertEqual(results, ["a", "b", "c"])
+    
+    async def test_per_call_error_yields_none(self):
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 2, "result": "b"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32602, "message": "Invalid params"}},
+        ]
+        results = await self.manager.rpc_batch([("m", [1]), ("m", [2])])
+        
+        self.assertEqual(results, [None, "b"])
+    
+    async def test_missing_and_unknown_ids(self):
+        # One reply missing, one with an id from outside this batch
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 99, "result": "stray"},
+            {"jsonrpc": "2.0", "id": 2, "result": "b"},
+        ]
+        results = await self.manager.rpc_batch([("m", [1]), ("m", [2])])
+        
+        self.assertEqual(results, [None, "b"])
+    
+    async def test_null_id_error_item_skipped(self):
+        # An invalid request inside a batch is answered with "id": null
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid request"}},
+            {"jsonrpc": "2.0", "id": 2, "result": "b"},
+        ]
+        results = await self.manager.rpc_batch([("m", [1]), ("m", [2])])
+        
+        self.assertEqual(results, [None, "b"])
+    
+    async def test_non_integer_ids_skipped(self):
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "result": "no id"},
+            {"jsonrpc": "2.0", "id": "1", "result": "string id"},
+            {"jsonrpc": "2.0", "id": 1, "result": "a"},
+        ]
+        results = await self.manager.rpc_batch([("m", [1])])
+        
+        self.assertEqual(results, ["a"])
+    
+    async def test_ids_continue_across_requests(self):
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 1, "result": "first"},
+        ]
+        await self.manager.rpc_batch([("m", [])])
+        
+        self.manager._post_json_rpc.return_value = [
+            {"jsonrpc": "2.0", "id": 3, "result": "y"},
+            {"jsonrpc": "2.0", "id": 2, "result": "x"},
+        ]
+        results = await self.manager.rpc_batch([("m", []), ("m", [])])
+        
+        self.assertEqual(self._sent_ids(), [2, 3])
+        self.assertEqual(results, ["x", "y"])
+    
+    async def test_whole_batch_rejected(self):
+        self.manager._post_json_rpc.return_value = {
+            "jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid request"}
+        }
+        with self.assertRaises(RuntimeError):
+            await self.manager.rpc_batch([("m", [])])
+    
+    async def test_empty_batch_sends_nothing(self):
+        self.assertEqual(await self.manager.rpc_batch([]), [])
+        self.manager._post_json_rpc.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
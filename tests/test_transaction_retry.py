@@ -0,0 +1,116 @@
+"""
+Tests for the wallet tracker's getTransaction fetch: commitment and the
+bounded re-queue of transactions the node can't return yet.
+"""
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitoring.wallet_tracker import WalletTracker
+
+WALLET = "wallet1"
+
+
+class TestTransactionRetry(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        settings = SimpleNamespace(tracking=SimpleNamespace(wallets=[]))
+        config_patcher = patch(
+            "src.monitoring.wallet_tracker.config_manager",
+            SimpleNamespace(get_settings=lambda: settings)
+        )
+        config_patcher.start()
+        self.addCleanup(config_patcher.stop)
+        
+        self.connection = SimpleNamespace(commitment="finalized", rpc_batch=AsyncMock())
+        connection_patcher = patch("src.monitoring.wallet_tracker.connection_manager", self.connection)
+        connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        
+        self.tracker = WalletTracker()
+        self.tracker.running = True
+        self.tracker.fetch_retry_delay = 0
+        self.tracker._handle_transaction = AsyncMock()
+    
+    async def asyncTearDown(self):
+        await self.tracker.stop()
+    
+    async def drain_retries(self):
+        """Let zero-delay retry timers fire and return what they re-queued."""
+        await asyncio.sleep(0.01)
+        items = []
+        while not self.tracker.analysis_queue.empty():
+            items.append(self.tracker.analysis_queue.get_nowait())
+        return items
+    
+    async def test_fetches_at_subscription_commitment(self):
+        self.connection.rpc_batch.return_value = [{"slot": 1}]
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET)])
+        
+        calls = self.connection.rpc_batch.await_args.args[0]
+        self.assertEqual(calls[0][1][1]["commitment"], "finalized")
+        self.tracker._handle_transaction.assert_awaited_once_with("sig1", {"slot": 1}, WALLET)
+        self.assertEqual(await self.drain_retries(), [])
+    
+    async def test_processed_commitment_fetches_confirmed(self):
+        self.connection.commitment = "processed"
+        self.connection.rpc_batch.return_value = [{"slot": 1}]
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET)])
+        
+        calls = self.connection.rpc_batch.await_args.args[0]
+        self.assertEqual(calls[0][1][1]["commitment"], "confirmed")
+    
+    async def test_null_result_is_requeued(self):
+        self.connection.rpc_batch.return_value = [None, {"slot": 2}]
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET), ("sig2", WALLET)])
+        
+        self.assertEqual(await self.drain_retries(), [("sig1", WALLET)])
+        self.tracker._handle_transaction.assert_awaited_once_with("sig2", {"slot": 2}, WALLET)
+        
+        # Found on the retry - attempts are forgotten
+        self.connection.rpc_batch.return_value = [{"slot": 1}]
+        await self.tracker._analyze_transactions([("sig1", WALLET)])
+        self.assertNotIn("sig1", self.tracker.fetch_attempts)
+    
+    async def test_retries_are_bounded(self):
+        self.connection.rpc_batch.return_value = [None]
+        
+        # The first fetch plus one per retry - the last miss is dropped
+        for _ in range(self.tracker.max_fetch_retries):
+            await self.tracker._analyze_transactions([("sig1", WALLET)])
+            self.assertEqual(await self.drain_retries(), [("sig1", WALLET)])
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET)])
+        self.assertEqual(await self.drain_retries(), [])
+        self.assertNotIn("sig1", self.tracker.fetch_attempts)
+    
+    async def test_failed_batch_is_requeued(self):
+        self.connection.rpc_batch.side_effect = ConnectionError("reset")
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET), ("sig2", WALLET)])
+        
+        self.assertEqual(await self.drain_retries(), [("sig1", WALLET), ("sig2", WALLET)])
+    
+    async def test_stop_cancels_pending_retries(self):
+        self.tracker.fetch_retry_delay = 60
+        self.connection.rpc_batch.return_value = [None]
+        
+        await self.tracker._analyze_transactions([("sig1", WALLET)])
+        handle = self.tracker._retry_handles["sig1"]
+        await self.tracker.stop()
+        
+        self.assertTrue(handle.cancelled())
+        self.assertEqual(self.tracker._retry_handles, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Tests for WebSocket subscription routing, listener teardown and close() in
+the connection manager.
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """In-memory socket that answers subscription requests like a node."""
+    
+    def __init__(self):
+        self.closed = False
+        self.sent = []
+        self._incoming: "asyncio.Queue[str]" = asyncio.Queue()
+        self._next_subscription = 0
+    
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        self.sent.append(request)
+        if request["method"].endswith("Unsubscribe"):
+            result = True
+        else:
+            # Node ids restart on every connection, like real nodes
+            self._next_subscription += 1
+            result = self._next_subscription
+        self.push({"jsonrpc": "2.0", "id": request["id"], "result": result})
+    
+    async def recv(self) -> str:
+        message = await self._incoming.get()
+        if message is None:
+            raise ConnectionError("socket closed")
+        return message
+    
+    async def ping(self) -> None:
+        pass
+    
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._incoming.put_nowait(None)
+    
+    def push(self, message: dict) -> None:
+        self._incoming.put_nowait(json.dumps(message))
+    
+    def notify(self, subscription: int, result) -> None:
+        self.push({
+            "jsonrpc": "2.0",
+            "method": "logsNotification",
+            "params": {"subscription": subscription, "result": result}
+        })
+
+
+async def settle() -> None:
+    """Let the listener and dispatch workers run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestWebSocketSubscriptions(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.manager = ConnectionManager()
+        self.manager.timeout = 1
+        self.sockets = []
+        
+        async def connect(_endpoint):
+            ws = FakeWebSocket()
+            self.sockets.append(ws)
+            return ws
+        
+        patcher = patch("src.core.connection_manager.websockets.connect", side_effect=connect)
+        self.connect = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    async def asyncTearDown(self):
+        await self.manager.close()
+    
+    async def test_concurrent_connects_share_one_socket(self):
+        results = await asyncio.gather(*(self.manager.connect_websocket() for _ in range(5)))
+        
+        self.assertEqual(self.connect.call_count, 1)
+        self.assertTrue(all(ws is self.sockets[0] for ws in results))
+    
+    async def test_notifications_routed_to_subscription_callback(self):
+        received_a, received_b = [], []
+        
+        async def on_a(result):
+            received_a.append(result)
+        
+        async def on_b(result):
+            received_b.append(result)
+        
+        handle_a = await self.manager.subscribe_logs("walletA", on_a)
+        handle_b = await self.manager.subscribe_logs("walletB", on_b)
+        self.assertNotEqual(handle_a, handle_b)
+        
+        ws = self.sockets[0]
+        ws.notify(1, "for a")
+        ws.notify(2, "for b")
+        ws.notify(99, "unknown")
+        await settle()
+        
+        self.assertEqual(received_a, ["for a"])
+        self.assertEqual(received_b, ["for b"])
+    
+    async def test_listener_teardown_drops_only_its_socket(self):
+        received_old, received_new = [], []
+        
+        async def on_old(result):
+            received_old.append(result)
+        
+        async def on_new(result):
+            received_new.append(result)
+        
+        old_handle = await self.manager.subscribe_logs("walletA", on_old)
+        old_socket = self.sockets[0]
+        
+        # Socket drops - its listener tears down its own subscriptions
+        await old_socket.close()
+        await settle()
+        self.assertIsNone(self.manager.websocket)
+        self.assertFalse(self.manager.is_subscription_active(old_handle))
+        
+        # A fresh socket reuses node id 1 for an unrelated subscription
+        new_handle = await self.manager.subscribe_logs("walletB", on_new)
+        new_socket = self.sockets[1]
+        self.assertIsNot(new_socket, old_socket)
+        self.assertTrue(self.manager.is_subscription_active(new_handle))
+        self.assertFalse(self.manager.is_subscription_active(old_handle))
+        
+        new_socket.notify(1, "new")
+        await settle()
+        self.assertEqual(received_new, ["new"])
+        self.assertEqual(received_old, [])
+    
+    async def test_unsubscribe_sends_node_id_and_stops_dispatch(self):
+        received = []
+        
+        async def on_logs(result):
+            received.append(result)
+        
+        handle = await self.manager.subscribe_logs("walletA", on_logs)
+        self.assertTrue(await self.manager.unsubscribe_logs(handle))
+        
+        ws = self.sockets[0]
+        self.assertEqual(ws.sent[-1]["method"], "logsUnsubscribe")
+        self.assertEqual(ws.sent[-1]["params"], [1])
+        self.assertFalse(self.manager.is_subscription_active(handle))
+        
+        ws.notify(1, "late")
+        await settle()
+        self.assertEqual(received, [])
+    
+    async def test_close_closes_socket_and_stops_listener(self):
+        async def on_logs(result):
+            pass
+        
+        handle = await self.manager.subscribe_logs("walletA", on_logs)
+        ws = self.sockets[0]
+        listener = self.manager._listener_task
+        
+        await self.manager.close()
+        
+        self.assertTrue(ws.closed)
+        self.assertTrue(listener.done())
+        self.assertIsNone(self.manager._listener_task)
+        self.assertIsNone(self.manager.websocket)
+        self.assertFalse(self.manager.is_subscription_active(handle))
+        self.assertEqual(self.manager._subscription_callbacks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()